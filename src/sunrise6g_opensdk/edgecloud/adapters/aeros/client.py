@@ -6,11 +6,15 @@
 #   - Andreas Sakellaropoulos (asakellaropoulos@iit.demokritos.gr)
 ##
 import json
-import uuid
-from collections import defaultdict
-from typing import Any, Dict, List, Optional
-
-from pydantic import ValidationError
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from pydantic import TypeAdapter, ValidationError
 from requests import Response
 
 from sunrise6g_opensdk.edgecloud.adapters.aeros import config
@@ -29,8 +33,10 @@ from sunrise6g_opensdk.edgecloud.adapters.aeros.storageManagement.appStorageMana
     AppStorageManager,
 )
 from sunrise6g_opensdk.edgecloud.adapters.aeros.utils import (
+    STREAM_ERRORS,
     encode_app_instance_name,
     map_aeros_service_status_to_gsma,
+    translate_stream_exception,
     urn_to_uuid,
 )
 from sunrise6g_opensdk.edgecloud.adapters.errors import EdgeCloudPlatformError
@@ -41,6 +47,41 @@ from sunrise6g_opensdk.edgecloud.core.edgecloud_interface import (
 from sunrise6g_opensdk.edgecloud.core.utils import build_custom_http_response
 from sunrise6g_opensdk.logger import setup_logger
 
+try:
+    import ijson
+except ImportError:  # optional streaming JSON parser
+    ijson = None
+
+_IJSON_ERRORS = (ijson.JSONError,) if ijson is not None else ()
+
+# Serializers for CAMARA app instances, built once and reused per response
+_INSTANCE_ADAPTER = TypeAdapter(camara_schemas.AppInstanceInfo)
+_INSTANCE_LIST_ADAPTER = TypeAdapter(List[camara_schemas.AppInstanceInfo])
+# Serializers for GSMA listings, dumping the whole list in one call
+_ARTEFACT_LIST_ADAPTER = TypeAdapter(List[gsma_schemas.Artefact])
+_GSMA_INSTANCE_LIST_ADAPTER = TypeAdapter(List[gsma_schemas.AppInstance])
+
+# Response headers shared (read-only) by every handler
+_JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+_NO_HEADERS = MappingProxyType({})
+
+
+class _ResponseInfo(NamedTuple):
+    """The parts of an aerOS response that derived responses carry over (see _http_from)."""
+
+    status_code: int
+    encoding: Optional[str]
+    url: Optional[str]
+    request: Any
+
+    @classmethod
+    def of(cls, resp: Response) -> "_ResponseInfo":
+        return cls(resp.status_code, resp.encoding, resp.url, resp.request)
+
+
+# aerOS domainStatus token (last URN segment, lowercased) -> CAMARA zone status
+_ZONE_STATUS_MAP = {"functional": "Active"}
+
 
 class EdgeApplicationManager(EdgeCloudManagementInterface):
     """
@@ -53,9 +94,27 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         """
         self.base_url = base_url
         self.logger = setup_logger(__name__, is_debug=True, file_name=config.LOG_FILE)
-        self.content_type_gsma = "application/json"
         self.encoding_gsma = "utf-8"
         self.storage = storage or inMemoryStorage.InMemoryAppStorage()
+        # app_id -> (stored manifest dict, its validated model); the model is reused only
+        # while storage still returns that same dict object
+        self._manifests: Dict[str, Tuple[Dict, camara_schemas.AppManifest]] = {}
+        # (expiry, aerOS response info, IEs grouped by domain, GSMA zones by domain)
+        # from the last successful continuum-wide query
+        self._ie_cache: Optional[
+            Tuple[
+                float,
+                _ResponseInfo,
+                Dict[str, List[Dict[str, Any]]],
+                Dict[str, aeros2gsma_zone_details.ZoneAccumulator],
+            ]
+        ] = None
+        # Serialized GSMA artefact/app bodies keyed by ("art"|"app", id), in LRU
+        # order, as (storage GSMA generation when read, body)
+        self._read_cache: "OrderedDict[Tuple[str, str], Tuple[int, str]]" = OrderedDict()
+        self._read_cache_lock = threading.Lock()
+        # Created on first use, once the config overrides below are applied
+        self._continuum_client: Optional[ContinuumClient] = None
 
         # Overwrite config values if provided via kwargs
         if "aerOS_API_URL" in kwargs:
@@ -72,6 +131,64 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         if not config.aerOS_HLO_TOKEN:
             raise ValueError("Missing 'aerOS_HLO_TOKEN'")
 
+    def _get_continuum_client(self) -> ContinuumClient:
+        """
+        Return the aerOS continuum client for base_url, creating it on first use
+        """
+        if self._continuum_client is None:
+            self._continuum_client = ContinuumClient(self.base_url)
+        return self._continuum_client
+
+    def _read_gsma_body(self, key: Tuple[str, str], load) -> Optional[str]:
+        """
+        Return the JSON body of the GSMA record load(key[1]) returns, or None if it is missing.
+        Bodies are reused only while the storage GSMA generation is unchanged, so writes
+        through any manager sharing the storage invalidate them; misses are never cached.
+        """
+        gen = self.storage.gsma_generation()
+        if gen is not None:
+            with self._read_cache_lock:
+                entry = self._read_cache.get(key)
+                if entry is not None and entry[0] == gen:
+                    self._read_cache.move_to_end(key)
+                    return entry[1]
+
+        # The generation was read before the record: if a write lands in between,
+        # the entry is tagged with the older generation and is never served
+        record = load(key[1])
+        if record is None:
+            return None
+        body = record.model_dump_json()
+        if gen is not None:
+            with self._read_cache_lock:
+                self._read_cache[key] = (gen, body)
+                self._read_cache.move_to_end(key)
+                if len(self._read_cache) > config.READ_CACHE_SIZE:
+                    self._read_cache.popitem(last=False)
+        return body
+
+    @staticmethod
+    def _http_from(
+        resp: Union[Response, _ResponseInfo],
+        content: Any,
+        *,
+        status_code: Optional[int] = None,
+        headers=_JSON_HEADERS,
+        encoding: Optional[str] = None,
+    ) -> Response:
+        """
+        Build a response for content derived from an aerOS response, carrying
+        over its status code, encoding, url and request unless overridden.
+        """
+        return build_custom_http_response(
+            status_code=status_code or resp.status_code,
+            content=content,
+            headers=headers,
+            encoding=encoding or resp.encoding,
+            url=resp.url,
+            request=resp.request,
+        )
+
     # ########################################################################
     # CAMARA EDGE CLOUD MANAGEMENT API
     # ########################################################################
@@ -92,48 +209,29 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         :return: Response with list of Edge Cloud Zones in CAMARA format.
         """
         try:
-            aeros_client = ContinuumClient(self.base_url)
+            aeros_client = self._get_continuum_client()
             ngsild_params = "type=Domain&format=simplified"
             camara_response = aeros_client.query_entities(ngsild_params)
             aeros_domains = camara_response.json()
             if config.DEBUG:
                 self.logger.debug("aerOS edge cloud zones: %s", aeros_domains)
 
-            zone_list = []
-            for domain in aeros_domains:
-                domain_id = domain.get("id")
-                if not domain_id:
-                    continue
-
-                # Normalize status
-                raw_status = domain.get("domainStatus", "")
-                status_token = raw_status.split(":")[-1].strip().lower()
-                status = "Active" if status_token == "functional" else "Unknown"
-
-                zone = {
-                    "edgeCloudZoneId": str(urn_to_uuid(domain_id)),
-                    "edgeCloudZoneName": domain_id,  # or domain_id.split(":")[-1] if you prefer short name
-                    "edgeCloudProvider": (
-                        domain.get("owner", ["unknown"])[0]
-                        if isinstance(domain.get("owner"), list)
-                        else domain.get("owner", "unknown")
-                    ),
-                    "status": status,
-                    "geographyDetails": "NOT_USED",
-                }
-                zone_list.append(zone)
+            # Zones keyed by the aerOS domain id, built in a single pass
+            to_zone = self._domain_to_camara_zone
+            zones_by_domain = {
+                zone["edgeCloudZoneName"]: zone
+                for domain in aeros_domains
+                if (zone := to_zone(domain)) is not None
+            }
+            zone_list = list(zones_by_domain.values())
 
             # Store zones keyed by the aerOS domain id
-            self.storage.store_zones({d["edgeCloudZoneName"]: d for d in zone_list})
+            self.storage.store_zones(zones_by_domain)
             if config.DEBUG:
                 self.logger.debug("aerOS Local domains store: %s", zone_list)
-            return build_custom_http_response(
-                status_code=camara_response.status_code,
-                content=zone_list,
-                headers={"Content-Type": "application/json"},
-                encoding=camara_response.encoding,
-                url=camara_response.url,
-                request=camara_response.request,
+            return self._http_from(
+                camara_response,
+                zone_list,
             )
         except json.JSONDecodeError as e:
             self.logger.error("Invalid JSON in aerOS response: %s", e)
@@ -145,6 +243,29 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
             self.logger.error("Error retrieving edge cloud zones: %s", e)
             raise
 
+    def _domain_to_camara_zone(self, domain: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Convert an aerOS Domain entity into a CAMARA Edge Cloud Zone dict.
+        :param domain: aerOS Domain (simplified NGSI-LD format)
+        :return: The zone, or None if the domain has no id
+        """
+        domain_id = domain.get("id")
+        if not domain_id:
+            return None
+
+        # Normalize status
+        raw_status = domain.get("domainStatus", "")
+        status_token = raw_status[raw_status.rfind(":") + 1 :].strip().lower()
+
+        owner = domain.get("owner", "unknown")
+        return {
+            "edgeCloudZoneId": str(urn_to_uuid(domain_id)),
+            "edgeCloudZoneName": domain_id,  # or domain_id.split(":")[-1] if you prefer short name
+            "edgeCloudProvider": owner[0] if isinstance(owner, list) else owner,
+            "status": _ZONE_STATUS_MAP.get(status_token, "Unknown"),
+            "geographyDetails": "NOT_USED",
+        }
+
     def get_edge_cloud_zones_details(self, zone_id: str, flavour_id: Optional[str] = None) -> Dict:
         """
         Get details of a specific edge cloud zone.
@@ -152,18 +273,11 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         :param flavour_id: Optional flavour ID to filter the results
         :return: Details of the edge cloud zone
         """
-        aeros_client = ContinuumClient(self.base_url)
-        ngsild_params = f'format=simplified&type=InfrastructureElement&q=domain=="{zone_id}"'
         if config.DEBUG:
-            self.logger.debug(
-                "Querying infrastructure elements for zone %s with params: %s",
-                zone_id,
-                ngsild_params,
-            )
+            self.logger.debug("Retrieving infrastructure elements for zone %s", zone_id)
         try:
-            # Query the infrastructure elements for the specified zonese
-            aeros_response = aeros_client.query_entities(ngsild_params)
-            aeros_domain_ies = aeros_response.json()
+            aeros_response, ies_by_domain, _ = self._query_ies_by_domain(zone_id)
+            aeros_domain_ies = ies_by_domain.get(zone_id, [])
             # Transform the infrastructure elements into the required format
             # and return the details of the edge cloud zone
             camara_response = self.transform_infrastructure_elements(
@@ -172,13 +286,9 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
             if config.DEBUG:
                 self.logger.debug("Transformed response: %s", camara_response)
             # Return the transformed response
-            return build_custom_http_response(
-                status_code=aeros_response.status_code,
-                content=camara_response,
-                headers={"Content-Type": "application/json"},
-                encoding=aeros_response.encoding,
-                url=aeros_response.url,
-                request=aeros_response.request,
+            return self._http_from(
+                aeros_response,
+                camara_response,
             )
         except json.JSONDecodeError as e:
             self.logger.error("Invalid JSON in aerOS response: %s", e)
@@ -190,6 +300,92 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
             self.logger.error("Error retrieving edge cloud zones: %s", e)
             raise
 
+    def _query_ies_by_domain(self, zone_id: Optional[str] = None) -> Tuple[
+        _ResponseInfo,
+        Dict[str, List[Dict[str, Any]]],
+        Dict[str, Dict[str, Any]],
+    ]:
+        """
+        Query the infrastructure elements of one zone (zone_id) or of the whole
+        continuum and group them by their aerOS domain, aggregating the GSMA zone
+        details in the same pass. A successful continuum-wide result is reused for
+        config.IE_CACHE_TTL seconds, for single zones too. Callers get their own IE
+        lists and GSMA zone dicts, but the IE dicts are shared: treat them as read-only.
+        :return: The aerOS response info, the IEs and the GSMA zone details by domain id
+        """
+        cached = self._ie_cache
+        if cached is not None and cached[0] > time.monotonic():
+            _, info, ies_by_domain, gsma_zones = cached
+            if zone_id is not None:
+                if zone_id not in ies_by_domain:
+                    return info, {}, {}
+                return (
+                    info,
+                    {zone_id: list(ies_by_domain[zone_id])},
+                    {zone_id: gsma_zones[zone_id].result()},
+                )
+            return (
+                info,
+                {d: list(ies) for d, ies in ies_by_domain.items()},
+                {d: zone.result() for d, zone in gsma_zones.items()},
+            )
+
+        aeros_client = self._get_continuum_client()
+        ngsild_params = "format=simplified&type=InfrastructureElement"
+        if zone_id is not None:
+            ngsild_params += f'&q=domain=="{zone_id}"'
+        if ijson is None:
+            aeros_response = aeros_client.query_entities(ngsild_params)
+        else:
+            # Parse IEs one by one off the wire instead of holding the raw body
+            # and the fully parsed list at the same time
+            aeros_response = aeros_client.query_entities_stream(ngsild_params)
+            aeros_response.raw.decode_content = True
+        info = _ResponseInfo.of(aeros_response)
+        ok = 200 <= info.status_code < 300
+
+        ies_by_domain: Dict[str, List[Dict[str, Any]]] = {}
+        gsma_zones: Dict[str, aeros2gsma_zone_details.ZoneAccumulator] = {}
+        zone_accumulator = aeros2gsma_zone_details.ZoneAccumulator
+        try:
+            # An error body is not a list of IEs: the caller only gets its status
+            if not ok:
+                aeros_ies = ()
+            elif ijson is None:
+                aeros_ies = aeros_response.json()
+            else:
+                aeros_ies = ijson.items(aeros_response.raw, "item", use_float=True)
+            for item in aeros_ies:
+                # The zone filter already pins the domain of every returned IE
+                domain = item["domain"] if zone_id is None else item.get("domain", zone_id)
+                domain_ies = ies_by_domain.get(domain)
+                if domain_ies is None:
+                    domain_ies = ies_by_domain[domain] = []
+                    gsma_zones[domain] = zone_accumulator(domain)
+                domain_ies.append(item)
+                gsma_zones[domain].add(item)
+        except _IJSON_ERRORS as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
+        except STREAM_ERRORS as e:
+            # The streamed body is read here, outside the decorated request call
+            translate_stream_exception(e, request=aeros_response.request)
+        finally:
+            aeros_response.close()
+
+        if ok and zone_id is None:
+            self._ie_cache = (
+                time.monotonic() + config.IE_CACHE_TTL,
+                info,
+                ies_by_domain,
+                gsma_zones,
+            )
+            return (
+                info,
+                {d: list(ies) for d, ies in ies_by_domain.items()},
+                {d: zone.result() for d, zone in gsma_zones.items()},
+            )
+        return info, ies_by_domain, {d: zone.result() for d, zone in gsma_zones.items()}
+
     def transform_infrastructure_elements(
         self, domain_ies: List[Dict[str, Any]], domain: str
     ) -> Dict[str, Any]:
@@ -260,7 +456,7 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
     # Onboarding methods
     def onboard_app(self, app_manifest: Dict) -> Response:
         # Validate CAMARA input
-        camara_schemas.AppManifest(**app_manifest)
+        validated_manifest = camara_schemas.AppManifest(**app_manifest)
 
         app_id = app_manifest.get("appId")
         if not app_id:
@@ -270,22 +466,25 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
             raise EdgeCloudPlatformError(f"Application with id '{app_id}' already exists")
 
         self.storage.store_app(app_id, app_manifest)
-        self.logger.debug("Onboarded application with id: %s", app_id)
+        self._manifests[app_id] = (app_manifest, validated_manifest)
+        if config.DEBUG:
+            self.logger.debug("Onboarded application with id: %s", app_id)
         submitted_app = camara_schemas.SubmittedApp(appId=camara_schemas.AppId(app_id))
         return build_custom_http_response(
             status_code=201,
-            content=submitted_app.model_dump(mode="json"),
-            headers={"Content-Type": "application/json"},
+            content=submitted_app.model_dump_json(),
+            headers=_JSON_HEADERS,
             encoding="utf-8",
         )
 
     def get_all_onboarded_apps(self) -> Response:
         apps = self.storage.list_apps()
-        self.logger.debug("Onboarded applications: %s", apps)
+        if config.DEBUG:
+            self.logger.debug("Onboarded applications: %s", apps)
         return build_custom_http_response(
             status_code=200,
             content=apps,
-            headers={"Content-Type": "application/json"},
+            headers=_JSON_HEADERS,
             encoding="utf-8",
         )
 
@@ -293,7 +492,8 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         app_data = self.storage.get_app(app_id)
         if not app_data:
             raise EdgeCloudPlatformError(f"Application with id '{app_id}' does not exist")
-        self.logger.debug("Retrieved application with id: %s", app_id)
+        if config.DEBUG:
+            self.logger.debug("Retrieved application with id: %s", app_id)
 
         app_manifest_response = {
             "appManifest": app_data
@@ -302,7 +502,7 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         return build_custom_http_response(
             status_code=200,
             content=app_manifest_response,
-            headers={"Content-Type": "application/json"},
+            headers=_JSON_HEADERS,
             encoding="utf-8",
         )
 
@@ -316,22 +516,25 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
             raise EdgeCloudPlatformError(
                 f"Application with id '{app_id}' cannot be deleted — please stop it first"
             )
-        self.logger.debug(
-            "Deleting application with id: %s and instances: %s",
-            app_id,
-            service_instances,
-        )
+        if config.DEBUG:
+            self.logger.debug(
+                "Deleting application with id: %s and instances: %s",
+                app_id,
+                service_instances,
+            )
         for service_instance in service_instances:
             self._purge_deployed_app_from_continuum(service_instance)
-            self.logger.debug("successfully purged service instance: %s", service_instance)
+            if config.DEBUG:
+                self.logger.debug("successfully purged service instance: %s", service_instance)
 
         self.storage.remove_stopped_instances(app_id)
         self.storage.delete_app(app_id)
+        self._manifests.pop(app_id, None)
 
         return build_custom_http_response(
             status_code=204,
             content=b"",  # absolutely no body for 204
-            headers={"Content-Type": "application/json"},
+            headers=_JSON_HEADERS,
             encoding="utf-8",
             # url=None,
             # request=None,
@@ -344,7 +547,7 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         :param app_id: The application ID
         :return: The generated service ID
         """
-        return f"{app_id}-{uuid.uuid4().hex[:4]}"
+        return f"{app_id}-{secrets.token_hex(2)}"
 
     def _generate_aeros_service_id(self, camara_app_instance_id: str) -> str:
         """
@@ -360,7 +563,16 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         app_manifest = self.storage.get_app(app_id)
         if not app_manifest:
             raise EdgeCloudPlatformError(f"Application with id '{app_id}' does not exist")
-        app_manifest = camara_schemas.AppManifest.model_validate(app_manifest)
+        # Reuse the validated model only for the very manifest object it was built
+        # from: an app re-onboarded through another manager (or a store that returns
+        # fresh objects, like SQLite) gets validated again
+        cached = self._manifests.get(app_id)
+        if cached is not None and cached[0] is app_manifest:
+            validated_manifest = cached[1]
+        else:
+            validated_manifest = camara_schemas.AppManifest.model_validate(app_manifest)
+            self._manifests[app_id] = (app_manifest, validated_manifest)
+        app_manifest = validated_manifest
 
         # 2. Generate unique service ID
         #    (aerOS) service id <=> CAMARA appInstanceId
@@ -368,11 +580,13 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
 
         # 3. Convert dict to YAML string
         # 3a. Get aerOS domain IDs from zones uuids
-        aeros_domain_ids = [
-            self.storage.resolve_domain_id_by_zone_uuid(z["EdgeCloudZone"]["edgeCloudZoneId"])
-            for z in app_zones
-            if z.get("EdgeCloudZone", {}).get("edgeCloudZoneId")
-        ]
+        zone_uuids = []
+        for z in app_zones:
+            edge_cloud_zone = z.get("EdgeCloudZone")
+            zone_uuid = edge_cloud_zone.get("edgeCloudZoneId") if edge_cloud_zone else None
+            if zone_uuid:
+                zone_uuids.append(zone_uuid)
+        aeros_domain_ids = self.storage.resolve_domain_ids_by_zone_uuids(zone_uuids)
         tosca_str = camara2aeros_converter.generate_tosca(
             app_manifest=app_manifest, app_zones=aeros_domain_ids
         )
@@ -382,7 +596,7 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
 
         # 4. Instantiate client and call continuum to deploy service
         try:
-            aeros_client = ContinuumClient(self.base_url)
+            aeros_client = self._get_continuum_client()
             aeros_response = aeros_client.onboard_and_deploy_service(
                 self._generate_aeros_service_id(service_id), tosca_str
             )
@@ -394,7 +608,7 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
 
             # Build CAMARA-compliant info
             app_provider_id = app_manifest.appProvider.root
-            zone_id = app_zones[0].get("EdgeCloudZone", {}).get("edgeCloudZoneId", "default-zone")
+            zone_id = zone_uuids[0] if zone_uuids else "default-zone"
             app_instance_info = camara_schemas.AppInstanceInfo(
                 name=camara_schemas.AppInstanceName(encode_app_instance_name(service_id)),
                 appId=camara_schemas.AppId(app_id),
@@ -406,23 +620,22 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
 
             # 5. Track deployment
             self.storage.store_deployment(app_instance=app_instance_info)
+            self._ie_cache = None  # IE resources change with the new deployment
 
             # 6. Return expected format
             self.logger.info("App deployment request submitted successfully")
 
             # CAMARA spec requires appInstances array wrapper
-            camara_response = app_instance_info.model_dump(mode="json")
+            camara_response = _INSTANCE_ADAPTER.dump_json(app_instance_info)
             # Add mandatory Location header
             location_url = f"/appinstances/{service_id}"
             camara_headers = {"Content-Type": "application/json", "Location": location_url}
 
-            return build_custom_http_response(
-                status_code=aeros_response.status_code,
-                content=camara_response,
+            return self._http_from(
+                aeros_response,
+                camara_response,
                 headers=camara_headers,
                 encoding="utf-8",
-                url=aeros_response.url,
-                request=aeros_response.request,
             )
         except EdgeCloudPlatformError as ex:
             # Catch all platform-specific errors.
@@ -443,10 +656,7 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
 
         # CAMARA spec format for multiple instances response
         camara_response = {
-            "appInstances": [
-                inst.model_dump(mode="json") if hasattr(inst, "model_dump") else inst
-                for inst in instances
-            ]
+            "appInstances": _INSTANCE_LIST_ADAPTER.dump_python(instances, mode="json")
         }
 
         self.logger.info("All app instances retrieved successfully")
@@ -455,7 +665,7 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         return build_custom_http_response(
             status_code=200,
             content=camara_response,
-            headers={"Content-Type": "application/json"},
+            headers=_JSON_HEADERS,
             encoding="utf-8",
             # url=response.url,
             # request=response.request,
@@ -498,12 +708,12 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
             inst = matches[0]
 
             # Serialize to JSON-safe dict
-            content = {"appInstance": inst.model_dump(mode="json")}
+            content = {"appInstance": _INSTANCE_ADAPTER.dump_python(inst, mode="json")}
 
             return build_custom_http_response(
                 status_code=200,
                 content=content,
-                headers={"Content-Type": "application/json"},
+                headers=_JSON_HEADERS,
                 encoding="utf-8",
             )
 
@@ -529,28 +739,25 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         :param app_id: The application ID to purge
         All instances of this app should be stopped
         """
-        aeros_client = ContinuumClient(self.base_url)
-        response = aeros_client.purge_service(self._generate_aeros_service_id(app_id))
-        if response:
-            self.logger.debug(
-                "Purged deployed application with id: %s", self._generate_aeros_service_id(app_id)
-            )
-        else:
+        aeros_client = self._get_continuum_client()
+        service_id = self._generate_aeros_service_id(app_id)
+        response = aeros_client.purge_service(service_id)
+        if not response:
             raise EdgeCloudPlatformError(
                 f"Failed to purge service with id from the continuum '{app_id}'"
             )
+        if config.DEBUG:
+            self.logger.debug("Purged deployed application with id: %s", service_id)
 
     def undeploy_app(self, app_instance_id: str) -> Response:
-        # 1. Locate app_id corresponding to this instance and
-        #    remove from deployed instances for this appId
-        app_id = self.storage.remove_deployment(app_instance_id=app_instance_id)
-        if not app_id:
+        # 1. Ensure the instance is tracked before touching the continuum
+        if not self.storage.find_deployments(app_instance_id=app_instance_id):
             raise EdgeCloudPlatformError(
                 f"No deployed app instance with ID '{app_instance_id}' found"
             )
 
         # 2. Call the external undeploy_service
-        aeros_client = ContinuumClient(self.base_url)
+        aeros_client = self._get_continuum_client()
         try:
             aeros_response = aeros_client.undeploy_service(
                 self._generate_aeros_service_id(app_instance_id)
@@ -564,16 +771,17 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         # 3. Purge the deployed app from continuum
         # self._purge_deployed_app_from_continuum(app_instance_id)
 
-        # 4. Clean up internal tracking
-        self.storage.remove_deployment(app_instance_id)
-        self.storage.store_stopped_instance(app_id, app_instance_id)
-        return build_custom_http_response(
+        # 4. Clean up internal tracking only once aerOS accepted the undeploy:
+        #    remove from deployed instances and mark as stopped for the later purge
+        self._ie_cache = None  # IE resources change once the service is gone
+        app_id = self.storage.remove_deployment(app_instance_id)
+        if app_id:
+            self.storage.store_stopped_instance(app_id, app_instance_id)
+        return self._http_from(
+            aeros_response,
+            "",
             status_code=204,
-            content="",
-            headers={"Content-Type": "application/json"},
             encoding="utf-8",
-            url=aeros_response.url,
-            request=aeros_response.request,
         )
 
     # ########################################################################
@@ -591,7 +799,7 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         :return: Response with zone details in GSMA format.
         """
         try:
-            aeros_client = ContinuumClient(self.base_url)
+            aeros_client = self._get_continuum_client()
             ngsild_params = "type=Domain&format=simplified"
             aeros_response = aeros_client.query_entities(ngsild_params)
             aeros_domains = aeros_response.json()
@@ -603,13 +811,11 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
                 }
                 for domain in aeros_domains
             ]
-            return build_custom_http_response(
-                status_code=aeros_response.status_code,
-                content=zone_list,
-                headers={"Content-Type": self.content_type_gsma},
+            return self._http_from(
+                aeros_response,
+                zone_list,
+                headers=_JSON_HEADERS,
                 encoding=self.encoding_gsma,
-                url=aeros_response.url,
-                request=aeros_response.request,
             )
         except json.JSONDecodeError as e:
             self.logger.error("Invalid JSON in aerOS response: %s", e)
@@ -629,34 +835,17 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
 
         :return: Response with zones and detailed resource information.
         """
-        aeros_client = ContinuumClient(self.base_url)
-        ngsild_params = "format=simplified&type=InfrastructureElement"
-
         try:
-            # Query the infrastructure elements whithin the whole continuum
-            aeros_response = aeros_client.query_entities(ngsild_params)
-            aeros_ies = aeros_response.json()  # IEs as list of dicts
-
-            # Create a dict that groups by "domain"
-            grouped_by_domain = defaultdict(list)
-            for item in aeros_ies:
-                domain = item["domain"]
-                grouped_by_domain[domain].append(item)
-
-            # Transform the IEs to required format
-            # per domain and append to response list
-            gsma_response = []
-            for domain, ies in grouped_by_domain.items():
-                result = aeros2gsma_zone_details.transformer(domain_ies=ies, domain=domain)
-                gsma_response.append(result)
+            # Query the infrastructure elements whithin the whole continuum;
+            # zones are aggregated per "domain" while the IEs are read
+            aeros_response, _, gsma_zones = self._query_ies_by_domain()
+            gsma_response = list(gsma_zones.values())
             # Return the transformed response
-            return build_custom_http_response(
-                status_code=aeros_response.status_code,
-                content=gsma_response,
-                headers={"Content-Type": self.content_type_gsma},
+            return self._http_from(
+                aeros_response,
+                gsma_response,
+                headers=_JSON_HEADERS,
                 encoding=self.encoding_gsma,
-                url=aeros_response.url,
-                request=aeros_response.request,
             )
         except json.JSONDecodeError as e:
             self.logger.error("Invalid JSON in aerOS response: %s", e)
@@ -676,35 +865,21 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         :param zone_id: Unique identifier of the Edge Cloud Zone.
         :return: Response with Edge Cloud Zone details.
         """
-        aeros_client = ContinuumClient(self.base_url)
-        ngsild_params = f'format=simplified&type=InfrastructureElement&q=domain=="{zone_id}"'
         if config.DEBUG:
-            self.logger.debug(
-                "Querying infrastructure elements for zone %s with params: %s",
-                zone_id,
-                ngsild_params,
-            )
+            self.logger.debug("Retrieving infrastructure elements for zone %s", zone_id)
         try:
-            # Query the infrastructure elements for the specified zonese
-            aeros_response = aeros_client.query_entities(ngsild_params)
-            aeros_domain_ies = aeros_response.json()
-            # Transform the infrastructure elements into the required format
-            # and return the details of the edge cloud zone
-            # camara_response = self.transform_infrastructure_elements(
-            #     domain_ies=aeros_domain_ies, domain=zone_id)
-            gsma_response = aeros2gsma_zone_details.transformer(
-                domain_ies=aeros_domain_ies, domain=zone_id
-            )
+            aeros_response, _, gsma_zones = self._query_ies_by_domain(zone_id)
+            # The zone details were aggregated in the required format
+            # while the infrastructure elements were read
+            gsma_response = gsma_zones.get(zone_id)
+            if gsma_response is None:
+                gsma_response = aeros2gsma_zone_details.ZoneAccumulator(zone_id).result()
             if config.DEBUG:
                 self.logger.debug("Transformed response: %s", gsma_response)
             # Return the transformed response
-            return build_custom_http_response(
-                status_code=aeros_response.status_code,
-                content=gsma_response,
-                headers={"Content-Type": "application/json"},
-                encoding=aeros_response.encoding,
-                url=aeros_response.url,
-                request=aeros_response.request,
+            return self._http_from(
+                aeros_response,
+                gsma_response,
             )
         except json.JSONDecodeError as e:
             self.logger.error("Invalid JSON in aerOS response: %s", e)
@@ -734,8 +909,8 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
             self.storage.store_artefact_gsma(artefact)
             return build_custom_http_response(
                 status_code=201,
-                content=artefact.model_dump(mode="json"),
-                headers={"Content-Type": self.content_type_gsma},
+                content=artefact.model_dump_json(),
+                headers=_JSON_HEADERS,
                 encoding=self.encoding_gsma,
             )
         except ValidationError as e:
@@ -749,23 +924,23 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         :param artefact_id: Unique identifier of the artefact.
         :return: Dictionary with artefact details.
         """
-        art = self.storage.get_artefact_gsma(artefact_id)
-        if not art:
+        body = self._read_gsma_body(("art", artefact_id), self.storage.get_artefact_gsma)
+        if body is None:
             raise ResourceNotFoundError(f"GSMA artefact '{artefact_id}' not found")
         return build_custom_http_response(
             status_code=200,
-            content=art.model_dump(mode="json"),
-            headers={"Content-Type": self.content_type_gsma},
+            content=body,
+            headers=_JSON_HEADERS,
             encoding=self.encoding_gsma,
         )
 
     def list_artefacts_gsma(self):
         """List all GSMA Artefacts."""
-        arts = [a.model_dump(mode="json") for a in self.storage.list_artefacts_gsma()]
+        arts = _ARTEFACT_LIST_ADAPTER.dump_json(self.storage.list_artefacts_gsma())
         return build_custom_http_response(
             status_code=200,
             content=arts,
-            headers={"Content-Type": self.content_type_gsma},
+            headers=_JSON_HEADERS,
             encoding=self.encoding_gsma,
         )
 
@@ -776,10 +951,11 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         :param artefact_id: Unique identifier of the artefact.
         :return:
         """
-        if not self.storage.get_artefact_gsma(artefact_id):
+        if self.storage.pop_artefact_gsma(artefact_id) is None:
             raise ResourceNotFoundError(f"GSMA artefact '{artefact_id}' not found")
-        self.storage.delete_artefact_gsma(artefact_id)
-        return build_custom_http_response(status_code=204, content=b"", headers={}, encoding=None)
+        return build_custom_http_response(
+            status_code=204, content=b"", headers=_NO_HEADERS, encoding=None
+        )
 
     # ------------------------------------------------------------------------
     # Application Onboarding Management (GSMA)
@@ -788,12 +964,14 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
     def _to_application_model(
         self, entry: gsma_schemas.AppOnboardManifestGSMA
     ) -> gsma_schemas.ApplicationModel:
-        """Internal helper to convert GSMA onboarding entry into canonical ApplicationModel."""
-        zones = [
-            gsma_schemas.AppDeploymentZone(countryCode="XX", zoneInfo=z)
-            for z in entry.appDeploymentZones
-        ]
-        return gsma_schemas.ApplicationModel(
+        """Internal helper to convert GSMA onboarding entry into canonical ApplicationModel.
+        The entry is already validated, so the models are constructed without re-validation;
+        only the non-empty list constraints of ApplicationModel are checked here."""
+        if not entry.appDeploymentZones or not entry.appComponentSpecs:
+            raise InvalidArgumentError("appDeploymentZones and appComponentSpecs must not be empty")
+        construct_zone = gsma_schemas.AppDeploymentZone.model_construct
+        zones = [construct_zone(countryCode="XX", zoneInfo=z) for z in entry.appDeploymentZones]
+        return gsma_schemas.ApplicationModel.model_construct(
             appId=entry.appId,
             appProviderId=entry.appProviderId,
             appDeploymentZones=zones,
@@ -833,8 +1011,8 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
             # Build and return confirmation response
             return build_custom_http_response(
                 status_code=201,
-                content=app_model.model_dump(mode="json"),
-                headers={"Content-Type": self.content_type_gsma},
+                content=app_model.model_dump_json(),
+                headers=_JSON_HEADERS,
                 encoding=self.encoding_gsma,
             )
         except EdgeCloudPlatformError as e:
@@ -852,14 +1030,14 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         :return: Dictionary with application details.
         """
         try:
-            app = self.storage.get_app_gsma(app_id)
-            if not app:
+            body = self._read_gsma_body(("app", app_id), self.storage.get_app_gsma)
+            if body is None:
                 raise ResourceNotFoundError(f"GSMA app '{app_id}' not found")
 
             return build_custom_http_response(
                 status_code=200,
-                content=app.model_dump(mode="json"),
-                headers={"Content-Type": self.content_type_gsma},
+                content=body,
+                headers=_JSON_HEADERS,
                 encoding=self.encoding_gsma,
             )
         except EdgeCloudPlatformError as e:
@@ -907,10 +1085,11 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
             if upd.mobilitySupport is not None:
                 app.appMetaData.mobilitySupport = upd.mobilitySupport
 
-            # Replace component specs if provided
+            # Replace component specs if provided. The patch specs were validated
+            # above with the same field types, so they are not validated again.
             if patch.appComponentSpecs:
                 app.appComponentSpecs = [
-                    gsma_schemas.AppComponentSpec(
+                    gsma_schemas.AppComponentSpec.model_construct(
                         serviceNameNB=p.serviceNameNB,
                         serviceNameEW=p.serviceNameEW,
                         componentName=p.componentName,
@@ -924,8 +1103,8 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
 
             return build_custom_http_response(
                 status_code=200,
-                content=app.model_dump(mode="json"),
-                headers={"Content-Type": self.content_type_gsma},
+                content=app.model_dump_json(),
+                headers=_JSON_HEADERS,
                 encoding=self.encoding_gsma,
             )
         except EdgeCloudPlatformError as e:
@@ -952,14 +1131,25 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
                 raise EdgeCloudPlatformError(
                     f"Application with id '{app_id}' cannot be deleted — please stop it first"
                 )
-            self.logger.debug(
-                "Deleting application with id: %s and instances: %s",
-                app_id,
-                service_instances,
-            )
-            for service_instance in service_instances:
-                self._purge_deployed_app_from_continuum_gsma(service_instance)
-                self.logger.debug("successfully purged service instance: %s", service_instance)
+            if config.DEBUG:
+                self.logger.debug(
+                    "Deleting application with id: %s and instances: %s",
+                    app_id,
+                    service_instances,
+                )
+            # Purges are independent continuum calls, so their round trips overlap;
+            # the first failure is re-raised when the results are consumed. The
+            # continuum client is created here so the workers only ever read it
+            self._get_continuum_client()
+            with ThreadPoolExecutor(max_workers=min(8, len(service_instances))) as executor:
+                for service_instance, _ in zip(
+                    service_instances,
+                    executor.map(self._purge_deployed_app_from_continuum_gsma, service_instances),
+                ):
+                    if config.DEBUG:
+                        self.logger.debug(
+                            "successfully purged service instance: %s", service_instance
+                        )
 
             self.storage.remove_stopped_instances_gsma(app_id)
 
@@ -968,7 +1158,7 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
             return build_custom_http_response(
                 status_code=204,
                 content=b"",
-                headers={},
+                headers=_NO_HEADERS,
                 encoding=None,
             )
         except EdgeCloudPlatformError as e:
@@ -984,14 +1174,14 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         :param app_id: The application ID to purge
         All instances of this app should be stopped
         """
-        aeros_client = ContinuumClient(self.base_url)
+        aeros_client = self._get_continuum_client()
         response = aeros_client.purge_service(app_instance_id)
-        if response:
-            self.logger.debug("Purged deployed application with id: %s", app_instance_id)
-        else:
+        if not response:
             raise EdgeCloudPlatformError(
                 f"Failed to purge service with id from the continuum '{app_instance_id}'"
             )
+        if config.DEBUG:
+            self.logger.debug("Purged deployed application with id: %s", app_instance_id)
 
     # ------------------------------------------------------------------------
     # Application Deployment Management (GSMA)
@@ -1034,38 +1224,43 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
             self.logger.info(tosca_yaml)
 
             # 4. Instantiate client and call continuum to deploy servic
-            aeros_client = ContinuumClient(self.base_url)
+            aeros_client = self._get_continuum_client()
             aeros_response = aeros_client.onboard_and_deploy_service(
                 service_id, tosca_str=tosca_yaml
             )
 
-            if "serviceId" not in aeros_response.json():
+            aeros_body = aeros_response.json()
+            if "serviceId" not in aeros_body:
                 raise EdgeCloudPlatformError(
                     "Invalid response from onboard_service: missing 'serviceId'"
                 )
 
             # 5. Track deployment (Store in GSMA deployment store)
             # Build AppInstance and optional status (if you want to persist status later)
-            inst = gsma_schemas.AppInstance(
-                zoneId=payload.zoneInfo.zoneId,
+            # Fields come from the validated payload and the generated service id,
+            # so the models are constructed without re-validation
+            zone_id = payload.zoneInfo.zoneId
+            inst = gsma_schemas.AppInstance.model_construct(
+                zoneId=zone_id,
                 appInstIdentifier=service_id,
             )
-            status = gsma_schemas.AppInstanceStatus(
+            status = gsma_schemas.AppInstanceStatus.model_construct(
                 appInstanceState="PENDING",
                 accesspointInfo=[],
             )
 
             self.storage.store_deployment_gsma(onboarded_app.appId, inst, status=status)
+            self._ie_cache = None  # IE resources change with the new deployment
 
             # 6. Return expected format (deployment details)
-            body = inst.model_dump(mode="json")
+            body = {"zoneId": zone_id, "appInstIdentifier": service_id}
 
             return build_custom_http_response(
                 status_code=202,
                 content=body,
-                headers={"Content-Type": self.content_type_gsma},
+                headers=_JSON_HEADERS,
                 encoding=self.encoding_gsma,
-                url=aeros_response.json().get("url", ""),
+                url=aeros_body.get("url", ""),
                 request=aeros_response.request,
             )
         except EdgeCloudPlatformError as ex:
@@ -1090,7 +1285,7 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
                 raise ResourceNotFoundError(f"GSMA app '{app_id}' not found")
 
             # 4. Instantiate client and call continuum to deploy servic
-            aeros_client = ContinuumClient(self.base_url)
+            aeros_client = self._get_continuum_client()
             aeros_response = aeros_client.query_entity(
                 entity_id=app_instance_id, ngsild_params="format=simplified"
             )
@@ -1106,15 +1301,12 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
                 ],
             )
 
-            validated_data = gsma_schemas.AppInstanceStatus.model_validate(content)
-
-            return build_custom_http_response(
+            return self._http_from(
+                aeros_response,
+                content.model_dump_json(),
                 status_code=200,
-                content=validated_data.model_dump(mode="json"),
-                headers={"Content-Type": self.content_type_gsma},
+                headers=_JSON_HEADERS,
                 encoding=self.encoding_gsma,
-                url=aeros_response.url,
-                request=aeros_response.request,
             )
         except EdgeCloudPlatformError:
             raise
@@ -1138,14 +1330,15 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         """
         try:
             insts = self.storage.find_deployments_gsma()
-            body = [i.model_dump(mode="json") for i in insts]
+            body = _GSMA_INSTANCE_LIST_ADAPTER.dump_json(insts)
             self.logger.info("All GSMA app instances retrieved successfully")
-            self.logger.debug("Deployed GSMA applications: %s", body)
+            if config.DEBUG:
+                self.logger.debug("Deployed GSMA applications: %s", body)
 
             return build_custom_http_response(
                 status_code=200,
                 content=body,
-                headers={"Content-Type": self.content_type_gsma},
+                headers=_JSON_HEADERS,
                 encoding=self.encoding_gsma,
             )
         except EdgeCloudPlatformError:
@@ -1178,7 +1371,7 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
                 )
 
             # 2. Call the external undeploy_service
-            aeros_client = ContinuumClient(self.base_url)
+            aeros_client = self._get_continuum_client()
             try:
                 aeros_response = aeros_client.undeploy_service(app_instance_id)
             except Exception as e:
@@ -1186,6 +1379,8 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
                     f"Failed to undeploy app instance '{app_instance_id}': {str(e)}"
                 ) from e
 
+            self._ie_cache = None  # IE resources change once the service is gone
+
             # Remove from deployed and mark as stopped so it can be purged later
             removed_app_id = self.storage.remove_deployment_gsma(app_instance_id)
             if removed_app_id:
@@ -1198,10 +1393,10 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
                 "zoneId": zone_id,
                 "state": "TERMINATING",
             }
-            return build_custom_http_response(
-                status_code=aeros_response.status_code,
-                content=body,
-                headers={"Content-Type": self.content_type_gsma},
+            return self._http_from(
+                aeros_response,
+                body,
+                headers=_JSON_HEADERS,
                 encoding=self.encoding_gsma,
             )
         except EdgeCloudPlatformError:
@@ -9,19 +9,18 @@
 aerOS access configuration
 Access tokens need to be provided in environment variables.
 """
-# import os
+import os
 
-# aerOS_API_URL = os.environ.get("aerOS_API_URL")
-aerOS_API_URL = "harcoded_api"
-if not aerOS_API_URL:
-    raise ValueError("Environment variable 'aerOS_API_URL' is not set.")
-# aerOS_ACCESS_TOKEN = os.environ.get("aerOS_ACCESS_TOKEN")
-aerOS_ACCESS_TOKEN = "harcoded_access_token"
-if not aerOS_ACCESS_TOKEN:
-    raise ValueError("Environment variable 'aerOS_ACCESS_TOKEN' is not set.")
-# aerOS_HLO_TOKEN = os.environ.get("aerOS_HLO_TOKEN")
-aerOS_HLO_TOKEN = "harcoded_hlo_token"
-if not aerOS_HLO_TOKEN:
-    raise ValueError("Environment variable 'aerOS_HLO_TOKEN' is not set.")
+# Read from the environment; EdgeApplicationManager kwargs override these and it
+# validates them when constructed, so a missing value does not fail the import
+aerOS_API_URL = os.environ.get("aerOS_API_URL")
+aerOS_ACCESS_TOKEN = os.environ.get("aerOS_ACCESS_TOKEN")
+aerOS_HLO_TOKEN = os.environ.get("aerOS_HLO_TOKEN")
 DEBUG = True
+# Seconds a continuum-wide InfrastructureElement query is reused for zone lookups
+IE_CACHE_TTL = 5
+# Max entries in the GSMA artefact/app read cache
+READ_CACHE_SIZE = 1024
+# Validate generated TOSCA documents against continuum_models before dumping them
+VALIDATE_TOSCA = False
 LOG_FILE = ".log/aeros_client.log"
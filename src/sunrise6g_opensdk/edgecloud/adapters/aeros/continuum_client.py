@@ -11,11 +11,27 @@ aerOS REST API Client
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from sunrise6g_opensdk.edgecloud.adapters.aeros import config
 from sunrise6g_opensdk.edgecloud.adapters.aeros.utils import catch_requests_exceptions
 from sunrise6g_opensdk.logger import setup_logger
 
+# Shared by all clients so the log file handler is opened once
+_LOGGER = setup_logger(__name__, is_debug=True, file_name=config.LOG_FILE)
+
+# Debug logs show only the start of a response body
+_DEBUG_BODY_BYTES = 512
+
+
+def _body_prefix(response: requests.Response) -> str:
+    """
+    Decode the first bytes of a response body for debug logging
+    """
+    return response.content[:_DEBUG_BODY_BYTES].decode(
+        response.encoding or "utf-8", errors="replace"
+    )
+
 
 class ContinuumClient:
     """
@@ -30,7 +46,14 @@ class ContinuumClient:
             self.api_url = config.aerOS_API_URL
         else:
             self.api_url = base_url
-        self.logger = setup_logger(__name__, is_debug=True, file_name=config.LOG_FILE)
+        # aerOS API URL templates, filled with % per call; a literal % in the
+        # base URL (e.g. percent-encoded path) is escaped so it survives formatting
+        base = self.api_url.replace("%", "%%")
+        self._entity_tmpl = base + "/entities/%s?%s"
+        self._entities_tmpl = base + "/entities?%s"
+        self._service_tmpl = base + "/hlo_fe/services/%s"
+        self._purge_tmpl = self._service_tmpl + "/purge"
+        self.logger = _LOGGER
         self.m2m_cb_token = config.aerOS_ACCESS_TOKEN
         self.hlo_token = config.aerOS_HLO_TOKEN
         self.headers = {
@@ -49,6 +72,24 @@ class ContinuumClient:
             "Content-Type": "application/yaml",
             "Authorization": f"Bearer {self.hlo_token}",
         }
+        # Keep-alive connections to the aerOS API, reused across calls; no
+        # automatic retries, as deploy/undeploy/purge are not safe to repeat
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self):
+        """
+        Close the pooled connections to the aerOS API
+        """
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     @catch_requests_exceptions
     def query_entity(self, entity_id, ngsild_params) -> requests.Response:
@@ -60,15 +101,15 @@ class ContinuumClient:
         :output
         ngsi-ld object
         """
-        entity_url = f"{self.api_url}/entities/{entity_id}?{ngsild_params}"
-        response = requests.get(entity_url, headers=self.headers, timeout=15)
+        entity_url = self._entity_tmpl % (entity_id, ngsild_params)
+        response = self._session.get(entity_url, headers=self.headers, timeout=15)
         if response is None:
             return None
         else:
             if config.DEBUG:
                 self.logger.debug("Query entity URL: %s", entity_url)
                 self.logger.debug(
-                    "Query entity response: %s %s", response.status_code, response.text
+                    "Query entity response: %s %s", response.status_code, _body_prefix(response)
                 )
             return response
 
@@ -81,8 +122,8 @@ class ContinuumClient:
         :output
         ngsi-ld object
         """
-        entities_url = f"{self.api_url}/entities?{ngsild_params}"
-        response = requests.get(entities_url, headers=self.headers, timeout=15)
+        entities_url = self._entities_tmpl % ngsild_params
+        response = self._session.get(entities_url, headers=self.headers, timeout=15)
         if response is None:
             return None
         # else:
@@ -92,6 +133,22 @@ class ContinuumClient:
         #                           response.status_code, response.text)
         return response
 
+    @catch_requests_exceptions
+    def query_entities_stream(self, ngsild_params) -> requests.Response:
+        """
+        Query entities with ngsi-ld params without reading the response body,
+        so that large results can be parsed incrementally from response.raw
+        :input
+        @param ngsi-ld: the query params
+        :output
+        streamed response (caller must close it)
+        """
+        entities_url = self._entities_tmpl % ngsild_params
+        response = self._session.get(entities_url, headers=self.headers, timeout=15, stream=True)
+        if response is None:
+            return None
+        return response
+
     @catch_requests_exceptions
     def deploy_service(self, service_id: str) -> dict:
         """
@@ -101,8 +158,8 @@ class ContinuumClient:
         :output
         the re-allocated service json object
         """
-        re_allocate_url = f"{self.api_url}/hlo_fe/services/{service_id}"
-        response = requests.put(re_allocate_url, headers=self.hlo_headers, timeout=15)
+        re_allocate_url = self._service_tmpl % service_id
+        response = self._session.put(re_allocate_url, headers=self.hlo_headers, timeout=15)
         if response is None:
             return None
         else:
@@ -111,7 +168,7 @@ class ContinuumClient:
                 self.logger.debug(
                     "Re-allocate service response: %s %s",
                     response.status_code,
-                    response.text,
+                    _body_prefix(response),
                 )
             return response.json()
 
@@ -124,18 +181,17 @@ class ContinuumClient:
         :output
         the undeployed service json object
         """
-        undeploy_url = f"{self.api_url}/hlo_fe/services/{service_id}"
-        response = requests.delete(undeploy_url, headers=self.hlo_headers, timeout=15)
+        undeploy_url = self._service_tmpl % service_id
+        response = self._session.delete(undeploy_url, headers=self.hlo_headers, timeout=15)
         if response is None:
             return None
         else:
-            self.logger.debug("In OK Undeploy and text: %s", response.text)
             if config.DEBUG:
-                self.logger.debug("Re-allocate service URL: %s", undeploy_url)
+                self.logger.debug("Undeploy service URL: %s", undeploy_url)
                 self.logger.debug(
                     "Undeploy service response: %s %s",
                     response.status_code,
-                    response.text,
+                    _body_prefix(response),
                 )
             return response
 
@@ -149,11 +205,11 @@ class ContinuumClient:
         :output
         the allocated service json object
         """
-        onboard_url = f"{self.api_url}/hlo_fe/services/{service_id}"
+        onboard_url = self._service_tmpl % service_id
         if config.DEBUG:
             self.logger.debug("Onboard service URL: %s", onboard_url)
             self.logger.debug("Onboard service request body (TOSCA-YAML): %s", tosca_str)
-        response = requests.post(
+        response = self._session.post(
             onboard_url, data=tosca_str, headers=self.hlo_onboard_headers, timeout=15
         )
         if response is None:
@@ -164,7 +220,7 @@ class ContinuumClient:
                 self.logger.debug(
                     "Onboard service response: %s %s",
                     response.status_code,
-                    response.text,
+                    _body_prefix(response),
                 )
             return response
 
@@ -177,8 +233,8 @@ class ContinuumClient:
         :output
         the purge result message from aerOS continuum
         """
-        purge_url = f"{self.api_url}/hlo_fe/services/{service_id}/purge"
-        response = requests.delete(purge_url, headers=self.hlo_headers, timeout=15)
+        purge_url = self._purge_tmpl % service_id
+        response = self._session.delete(purge_url, headers=self.hlo_headers, timeout=15)
         if response is None:
             return False
         else:
@@ -187,7 +243,7 @@ class ContinuumClient:
                 self.logger.debug(
                     "Purge service response: %s %s",
                     response.status_code,
-                    response.text,
+                    _body_prefix(response),
                 )
             if response.status_code != 200:
                 self.logger.error("Failed to purge service: %s", response.text)
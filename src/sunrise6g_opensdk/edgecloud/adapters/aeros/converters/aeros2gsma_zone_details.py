@@ -2,103 +2,162 @@
 aeros2gsma_zone_details.py
 """
 
-from typing import Any, Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Tuple
+
+# cpuArchitecture URN tail -> GSMA ISA_* literal
+# (GSMA only has ARM_64 vs X86/X86_64, so 32-bit ARM maps to the closest)
+_ISA_MAP = MappingProxyType(
+    {
+        "x64": "ISA_X86_64",
+        "x86_64": "ISA_X86_64",
+        "amd64": "ISA_X86_64",
+        "x86": "ISA_X86",
+        "i386": "ISA_X86",
+        "i686": "ISA_X86",
+        "arm64": "ISA_ARM_64",
+        "aarch64": "ISA_ARM_64",
+        "arm32": "ISA_ARM_64",
+        "arm": "ISA_ARM_64",
+    }
+)
+
+# Preference order of the aggregate reserved/quota ISA (lower wins)
+_ISA_PRIORITY = MappingProxyType({"ISA_X86_64": 0, "ISA_ARM_64": 1, "ISA_X86": 2})
+
+# cpuArchitecture URN tail -> OSType.architecture literal
+_OSTYPE_ARCH_MAP = MappingProxyType(
+    {
+        "x64": "x86_64",
+        "x86_64": "x86_64",
+        "amd64": "x86_64",
+        "arm64": "x86_64",
+        "aarch64": "x86_64",
+        "x86": "x86",
+        "i386": "x86",
+        "i686": "x86",
+        "arm32": "x86",
+        "arm": "x86",
+    }
+)
+
+
+def _urn_tail(urn: Any) -> str:
+    """Lower-cased last ':'-separated segment of a URN ('' for non-strings)."""
+    return urn.rpartition(":")[2].lower() if isinstance(urn, str) else ""
 
 
-def transformer(domain_ies: List[Dict[str, Any]], domain: str) -> Dict[str, Any]:  # noqa: C901
+def map_cpu_arch_to_isa(urn: str) -> str:
     """
-    Transform aerOS InfrastructureElements into GSMA ZoneRegisteredData structure.
-    :param domain_ies: List of aerOS InfrastructureElement dicts
-    :param domain: The ID of the edge cloud zone (zoneId)
-    :return: Dict matching gsma_schemas.ZoneRegisteredData (JSON-serializable)
+    Map aerOS cpuArchitecture URN to GSMA ISA_* literal.
+    Examples:
+      'urn:ngsi-ld:CpuArchitecture:x64'   -> 'ISA_X86_64'
+      'urn:ngsi-ld:CpuArchitecture:arm64' -> 'ISA_ARM_64'
+      'urn:ngsi-ld:CpuArchitecture:arm32' -> 'ISA_ARM_64' (closest)
+      'urn:ngsi-ld:CpuArchitecture:x86'   -> 'ISA_X86'
+    Fallback: 'ISA_X86_64'
     """
+    return _ISA_MAP.get(_urn_tail(urn), "ISA_X86_64")
 
-    def map_cpu_arch_to_isa(urn: str) -> str:
-        """
-        Map aerOS cpuArchitecture URN to GSMA ISA_* literal.
-        Examples:
-          'urn:ngsi-ld:CpuArchitecture:x64'   -> 'ISA_X86_64'
-          'urn:ngsi-ld:CpuArchitecture:arm64' -> 'ISA_ARM_64'
-          'urn:ngsi-ld:CpuArchitecture:arm32' -> 'ISA_ARM_64' (closest)
-          'urn:ngsi-ld:CpuArchitecture:x86'   -> 'ISA_X86'
-        Fallback: 'ISA_X86_64'
-        """
-        if not isinstance(urn, str):
-            return "ISA_X86_64"
-        tail = urn.split(":")[-1].lower()
-        if tail in ("x64", "x86_64", "amd64"):
-            return "ISA_X86_64"
-        if tail in ("x86", "i386", "i686"):
-            return "ISA_X86"
-        if tail in ("arm64", "aarch64"):
-            return "ISA_ARM_64"
-        if tail in ("arm32", "arm"):
-            # GSMA only has ARM_64 vs X86/X86_64; pick closest
-            return "ISA_ARM_64"
-        return "ISA_X86_64"
-
-    def map_cpu_arch_to_ostype_arch(urn: str) -> str:
-        """
-        Map aerOS cpuArchitecture URN to OSType.architecture literal: 'x86_64' or 'x86'.
-        Use 'x86_64' for x64/arm64 (closest allowed), and 'x86' for x86/arm32.
-        """
-        if not isinstance(urn, str):
-            return "x86_64"
-        tail = urn.split(":")[-1].lower()
-        if tail in ("x64", "x86_64", "amd64", "arm64", "aarch64"):
-            return "x86_64"
-        if tail in ("x86", "i386", "i686", "arm32", "arm"):
-            return "x86"
-        return "x86_64"
-
-    def map_os_distribution(_urn: str) -> str:
-        """
-        aerOS uses 'urn:ngsi-ld:OperatingSystem:Linux' etc.
-        map Linux -> UBUNTU (assume), else OTHER.
-        """
-        if isinstance(_urn, str) and _urn.split(":")[-1].lower() == "linux":
-            return "UBUNTU"
-        return "OTHER"
 
-    def default_os_version(dist: str) -> str:
-        # You asked to assume Ubuntu 22.04 LTS for Linux
-        return "OS_VERSION_UBUNTU_2204_LTS" if dist == "UBUNTU" else "OTHER"
+def map_cpu_arch_to_ostype_arch(urn: str) -> str:
+    """
+    Map aerOS cpuArchitecture URN to OSType.architecture literal: 'x86_64' or 'x86'.
+    Use 'x86_64' for x64/arm64 (closest allowed), and 'x86' for x86/arm32.
+    """
+    return _OSTYPE_ARCH_MAP.get(_urn_tail(urn), "x86_64")
 
-    # Totals (aggregate over elements)
-    total_cpu = 0
-    total_ram = 0
-    total_disk = 0
-    total_available_ram = 0
-    total_available_disk = 0
 
-    flavours_supported: List[Dict[str, Any]] = []
-    seen_cpu_isas: set[str] = set()
+def map_os_distribution(_urn: str) -> str:
+    """
+    aerOS uses 'urn:ngsi-ld:OperatingSystem:Linux' etc.
+    map Linux -> UBUNTU (assume), else OTHER.
+    """
+    return "UBUNTU" if _urn_tail(_urn) == "linux" else "OTHER"
 
-    for element in domain_ies:
-        cpu_cores = int(element.get("cpuCores", 0) or 0)
-        ram_cap = int(element.get("ramCapacity", 0) or 0)  # MB?
-        avail_ram = int(element.get("availableRam", 0) or 0)  # MB?
-        disk_cap = int(element.get("diskCapacity", 0) or 0)  # MB/GB? (pass-through)
-        avail_disk = int(element.get("availableDisk", 0) or 0)
-
-        total_cpu += cpu_cores
-        total_ram += ram_cap
-        total_available_ram += avail_ram
-        total_disk += disk_cap
-        total_available_disk += avail_disk
-
-        cpu_arch_urn = element.get("cpuArchitecture", "")
-        os_urn = element.get("operatingSystem", "")
-
-        isa = map_cpu_arch_to_isa(cpu_arch_urn)
-        seen_cpu_isas.add(isa)
-        ost_arch = map_cpu_arch_to_ostype_arch(cpu_arch_urn)
-        dist = map_os_distribution(os_urn)
-        ver = default_os_version(dist)
+
+def default_os_version(dist: str) -> str:
+    # You asked to assume Ubuntu 22.04 LTS for Linux
+    return "OS_VERSION_UBUNTU_2204_LTS" if dist == "UBUNTU" else "OTHER"
+
+
+# A zone only carries a handful of distinct architecture/OS URNs, so the
+# per-element mappings are memoized on the (string) URN
+@lru_cache(maxsize=64)
+def _cpu_arch_info(urn: str) -> Tuple[str, str]:
+    """(ISA_* literal, OSType.architecture) for a cpuArchitecture URN."""
+    return map_cpu_arch_to_isa(urn), map_cpu_arch_to_ostype_arch(urn)
+
+
+@lru_cache(maxsize=64)
+def _os_info(urn: str) -> Tuple[str, str]:
+    """(distribution, version) for an operatingSystem URN."""
+    dist = map_os_distribution(urn)
+    return dist, default_os_version(dist)
+
+
+_DEFAULT_CPU_ARCH_INFO = ("ISA_X86_64", "x86_64")
+_DEFAULT_OS_INFO = ("OTHER", "OTHER")
+
+
+class ZoneAccumulator:
+    """
+    Running aggregate of the aerOS InfrastructureElements of one domain.
+    Elements are added one at a time, so zones can be built in the same pass
+    that reads (or groups) the elements.
+    """
+
+    __slots__ = (
+        "domain",
+        "total_cpu",
+        "total_ram",
+        "total_disk",
+        "total_available_ram",
+        "total_available_disk",
+        "flavours_supported",
+        "seen_cpu_isas",
+    )
+
+    def __init__(self, domain: str):
+        self.domain = domain
+        # Totals (aggregate over elements)
+        self.total_cpu = 0
+        self.total_ram = 0
+        self.total_disk = 0
+        self.total_available_ram = 0
+        self.total_available_disk = 0
+        self.flavours_supported: List[Dict[str, Any]] = []
+        self.seen_cpu_isas: set[str] = set()
+
+    def add(self, element: Dict[str, Any]) -> None:
+        """Fold one InfrastructureElement into the zone totals and flavours."""
+        get = element.get
+        cpu_cores = int(get("cpuCores") or 0)
+        ram_cap = int(get("ramCapacity") or 0)  # MB?
+        avail_ram = int(get("availableRam") or 0)  # MB?
+        disk_cap = int(get("diskCapacity") or 0)  # MB/GB? (pass-through)
+        avail_disk = int(get("availableDisk") or 0)
+
+        self.total_cpu += cpu_cores
+        self.total_ram += ram_cap
+        self.total_available_ram += avail_ram
+        self.total_disk += disk_cap
+        self.total_available_disk += avail_disk
+
+        cpu_arch_urn = get("cpuArchitecture")
+        os_urn = get("operatingSystem")
+        isa, ost_arch = (
+            _cpu_arch_info(cpu_arch_urn)
+            if isinstance(cpu_arch_urn, str)
+            else _DEFAULT_CPU_ARCH_INFO
+        )
+        self.seen_cpu_isas.add(isa)
+        dist, ver = _os_info(os_urn) if isinstance(os_urn, str) else _DEFAULT_OS_INFO
 
         # Create a flavour per machine
         flavour = {
-            "flavourId": f"{element.get('hostname', 'host')}-{element.get('containerTechnology', 'CT')}",
+            "flavourId": f"{get('hostname', 'host')}-{get('containerTechnology', 'CT')}",
             "cpuArchType": isa,  # Literal ISA_*
             "supportedOSTypes": [
                 {
@@ -112,41 +171,52 @@ def transformer(domain_ies: List[Dict[str, Any]], domain: str) -> Dict[str, Any]
             "memorySize": ram_cap,
             "storageSize": disk_cap,
         }
-        flavours_supported.append(flavour)
-
-    # Decide a single ISA for the aggregate reserved/quota entries
-    # Preference order: X86_64, ARM_64, X86
-    def pick_aggregate_isa() -> str:
-        if "ISA_X86_64" in seen_cpu_isas:
-            return "ISA_X86_64"
-        if "ISA_ARM_64" in seen_cpu_isas:
-            return "ISA_ARM_64"
-        if "ISA_X86" in seen_cpu_isas:
-            return "ISA_X86"
-        # fallback
-        return "ISA_X86_64"
-
-    agg_isa = pick_aggregate_isa()
-
-    result = {
-        "zoneId": domain,
-        "reservedComputeResources": [
-            {
-                "cpuArchType": agg_isa,
-                "numCPU": int(
-                    total_cpu
-                ),  # Same as Quotas untill we have somem policy or data to differentiate
-                "memory": total_ram,  # ditto
-            }
-        ],
-        "computeResourceQuotaLimits": [
-            {
-                "cpuArchType": agg_isa,
-                "numCPU": int(total_cpu),
-                "memory": total_ram,
-            }
-        ],
-        "flavoursSupported": flavours_supported,
-    }
+        self.flavours_supported.append(flavour)
 
-    return result
+    def pick_aggregate_isa(self) -> str:
+        """
+        Decide a single ISA for the aggregate reserved/quota entries
+        Preference order: X86_64, ARM_64, X86
+        """
+        return min(self.seen_cpu_isas, key=_ISA_PRIORITY.__getitem__, default="ISA_X86_64")
+
+    def result(self) -> Dict[str, Any]:
+        """Build the GSMA ZoneRegisteredData dict from the elements added so far."""
+        agg_isa = self.pick_aggregate_isa()
+        return {
+            "zoneId": self.domain,
+            "reservedComputeResources": [
+                {
+                    "cpuArchType": agg_isa,
+                    "numCPU": int(
+                        self.total_cpu
+                    ),  # Same as Quotas untill we have somem policy or data to differentiate
+                    "memory": self.total_ram,  # ditto
+                }
+            ],
+            "computeResourceQuotaLimits": [
+                {
+                    "cpuArchType": agg_isa,
+                    "numCPU": int(self.total_cpu),
+                    "memory": self.total_ram,
+                }
+            ],
+            # copies, so callers may change them without touching the aggregate
+            "flavoursSupported": [
+                {**flavour, "supportedOSTypes": [dict(o) for o in flavour["supportedOSTypes"]]}
+                for flavour in self.flavours_supported
+            ],
+        }
+
+
+def transformer(domain_ies: List[Dict[str, Any]], domain: str) -> Dict[str, Any]:
+    """
+    Transform aerOS InfrastructureElements into GSMA ZoneRegisteredData structure.
+    :param domain_ies: List of aerOS InfrastructureElement dicts
+    :param domain: The ID of the edge cloud zone (zoneId)
+    :return: Dict matching gsma_schemas.ZoneRegisteredData (JSON-serializable)
+    """
+    zone = ZoneAccumulator(domain)
+    for element in domain_ies:
+        zone.add(element)
+    return zone.result()
@@ -5,27 +5,13 @@ It includes the `generate_tosca` function that constructs a TOSCA model based on
 the application manifest and associated app zones.
 """
 
-from typing import List
-
-import yaml
+from typing import Any, Dict, List
 
 from sunrise6g_opensdk.edgecloud.adapters.aeros import config
-from sunrise6g_opensdk.edgecloud.adapters.aeros.continuum_models import (
-    TOSCA,
-    ArtifactModel,
-    CustomRequirement,
-    DomainIdOperator,
-    ExposedPort,
-    HostCapability,
-    HostRequirement,
-    NetworkProperties,
-    NetworkRequirement,
-    NodeFilter,
-    NodeTemplate,
-    PortProperties,
-)
-from sunrise6g_opensdk.edgecloud.adapters.aeros.continuum_models import (
-    Property as HostProperty,
+from sunrise6g_opensdk.edgecloud.adapters.aeros.continuum_models import TOSCA
+from sunrise6g_opensdk.edgecloud.adapters.aeros.converters.tosca_yaml import (
+    dump_tosca,
+    host_properties,
 )
 from sunrise6g_opensdk.edgecloud.core.camara_schemas import AppManifest, VisibilityType
 from sunrise6g_opensdk.logger import setup_logger
@@ -42,16 +28,34 @@ def generate_tosca(app_manifest: AppManifest, app_zones: List[str]) -> str:
     Returns:
         TOSCA yaml as string which can be used in a POST request with applcation type yaml
     """
+    tosca_dict = generate_tosca_dict(app_manifest, app_zones)
+    if config.VALIDATE_TOSCA:
+        TOSCA.model_validate(tosca_dict)
+
+    return dump_tosca(tosca_dict)
+
+
+def generate_tosca_dict(app_manifest: AppManifest, app_zones: List[str]) -> Dict[str, Any]:
+    """
+    Build the TOSCA document for the application manifest as plain Python data.
+    Args:
+        app_manifest (AppManifest): The (already validated) application manifest.
+        app_zones (List[str]): aerOS domain ids; the first one is used in the host filter.
+    Returns:
+        TOSCA document dict, laid out as continuum_models.TOSCA
+    """
     component = app_manifest.componentSpec[0]
     image_path = app_manifest.appRepo.imagePath.root
-    image_file = image_path.split("/")[-1]
-    repository_url = "/".join(image_path.split("/")[:-1]) if "/" in image_path else "docker_hub"
+    repository_url, sep, image_file = image_path.rpartition("/")
+    if not sep:
+        repository_url = "docker_hub"
 
     zone_id = app_zones[0]
-    logger.info("DEBUG : %s", app_manifest.requiredResources.root)
-    # Extract minNodeMemory (fallback = 1024 MB)
-
     res = app_manifest.requiredResources.root
+    if config.DEBUG:
+        logger.debug("requiredResources: %r", res)
+
+    # Extract minNodeMemory (fallback = 1024 MB)
     if hasattr(res, "applicationResources") and hasattr(
         res.applicationResources.cpuPool.topology, "minNodeMemory"
     ):
@@ -59,61 +63,44 @@ def generate_tosca(app_manifest: AppManifest, app_zones: List[str]) -> str:
     else:
         min_node_memory = 1024
 
-    # Build exposed network ports
-    ports = {
-        iface.interfaceId: ExposedPort(
-            properties=PortProperties(protocol=[iface.protocol.value.lower()], source=iface.port)
-        )
-        for iface in component.networkInterfaces
-    }
-
-    expose_ports = any(
-        iface.visibilityType == VisibilityType.VISIBILITY_EXTERNAL
-        for iface in component.networkInterfaces
-    )
+    # Build exposed network ports and the visibility flag in one pass
+    ports = {}
+    expose_ports = False
+    for iface in component.networkInterfaces:
+        ports[iface.interfaceId] = {
+            "properties": {"protocol": [iface.protocol.value.lower()], "source": iface.port}
+        }
+        if iface.visibilityType == VisibilityType.VISIBILITY_EXTERNAL:
+            expose_ports = True
 
     # Define host property constraints
-    host_props = HostProperty(
-        cpu_arch={"equal": "x64"},
-        realtime={"equal": False},
-        cpu_usage={"less_or_equal": "0.4"},
-        mem_size={"greater_or_equal": str(min_node_memory)},
-        energy_efficiency={"greater_or_equal": "0"},
-        green={"greater_or_equal": "0"},
-        domain_id=DomainIdOperator(equal=zone_id),
-    )
+    host_props = host_properties(str(min_node_memory), zone_id)
 
     # Create Node compute and network requirements
     requirements = [
-        CustomRequirement(
-            network=NetworkRequirement(
-                properties=NetworkProperties(ports=ports, exposePorts=expose_ports)
-            )
-        ),
-        CustomRequirement(
-            host=HostRequirement(
-                node_filter=NodeFilter(
-                    capabilities=[{"host": HostCapability(properties=host_props)}], properties=None
-                )
-            )
-        ),
+        {"network": {"properties": {"ports": ports, "exposePorts": expose_ports}}},
+        {"host": {"node_filter": {"capabilities": [{"host": {"properties": host_props}}]}}},
     ]
-    # Define the NodeTemplate
-    node_template = NodeTemplate(
-        type="tosca.nodes.Container.Application",
-        isJob=False,
-        requirements=requirements,
-        artifacts={
-            "application_image": ArtifactModel(
-                file=image_file,
-                type="tosca.artifacts.Deployment.Image.Container.Docker",
-                repository=repository_url,
-                is_private=app_manifest.appRepo.type == "PRIVATEREPO",
-                username=app_manifest.appRepo.userName,
-                password=app_manifest.appRepo.credentials,
-            )
-        },
-        interfaces={
+
+    # Container image, with registry credentials only when provided
+    app_repo = app_manifest.appRepo
+    application_image = {
+        "file": image_file,
+        "type": "tosca.artifacts.Deployment.Image.Container.Docker",
+        "repository": repository_url,
+        "is_private": app_repo.type == "PRIVATEREPO",
+    }
+    if app_repo.userName is not None:
+        application_image["username"] = app_repo.userName
+    if app_repo.credentials is not None:
+        application_image["password"] = app_repo.credentials
+
+    # Define the NodeTemplate (continuum_models.NodeTemplate field order)
+    node_template = {
+        "type": "tosca.nodes.Container.Application",
+        "requirements": requirements,
+        "artifacts": {"application_image": application_image},
+        "interfaces": {
             "Standard": {
                 "create": {
                     "implementation": "application_image",
@@ -121,23 +108,13 @@ def generate_tosca(app_manifest: AppManifest, app_zones: List[str]) -> str:
                 }
             }
         },
-    )
-
-    # Assemble full TOSCA object
-    tosca = TOSCA(
-        tosca_definitions_version="tosca_simple_yaml_1_3",
-        description=f"TOSCA for {app_manifest.name}",
-        serviceOverlay=False,
-        node_templates={component.componentName: node_template},
-    )
-
-    tosca_dict = tosca.model_dump(by_alias=True, exclude_none=True)
-
-    for template in tosca_dict.get("node_templates", {}).values():
-        template["requirements"] = [
-            {k: v for k, v in req.items() if v is not None}
-            for req in template.get("requirements", [])
-        ]
-
-    yaml_str = yaml.dump(tosca_dict, sort_keys=False)
-    return yaml_str
+        "isJob": False,
+    }
+
+    # Assemble full TOSCA document
+    return {
+        "tosca_definitions_version": "tosca_simple_yaml_1_3",
+        "description": f"TOSCA for {app_manifest.name}",
+        "serviceOverlay": False,
+        "node_templates": {component.componentName: node_template},
+    }
@@ -10,27 +10,13 @@ Notes:
 - Network ports are omitted for now (exposePorts = False).
 """
 
-from typing import Callable, Dict, List, Optional
-
-import yaml
+from typing import Any, Callable, Dict, List, Optional
 
 from sunrise6g_opensdk.edgecloud.adapters.aeros import config
-from sunrise6g_opensdk.edgecloud.adapters.aeros.continuum_models import (
-    TOSCA,
-    ArtifactModel,
-    CustomRequirement,
-    DomainIdOperator,
-    ExposedPort,
-    HostCapability,
-    HostRequirement,
-    NetworkProperties,
-    NetworkRequirement,
-    NodeFilter,
-    NodeTemplate,
-    PortProperties,
-)
-from sunrise6g_opensdk.edgecloud.adapters.aeros.continuum_models import (
-    Property as HostProperty,
+from sunrise6g_opensdk.edgecloud.adapters.aeros.continuum_models import TOSCA
+from sunrise6g_opensdk.edgecloud.adapters.aeros.converters.tosca_yaml import (
+    dump_tosca,
+    host_properties,
 )
 from sunrise6g_opensdk.edgecloud.adapters.aeros.errors import (
     InvalidArgumentError,
@@ -41,10 +27,20 @@ from sunrise6g_opensdk.logger import setup_logger
 
 logger = setup_logger(__name__, is_debug=True, file_name=config.LOG_FILE)
 
+# Lower-cased forms of the usual exposedInterfaces protocols
+_PROTO_MAP = {
+    "TCP": "tcp",
+    "tcp": "tcp",
+    "UDP": "udp",
+    "udp": "udp",
+    "SCTP": "sctp",
+    "sctp": "sctp",
+}
+
 
 def generate_tosca_from_gsma_with_artefacts(  # noqa: C901
     app_model: gsma_schemas.ApplicationModel,
-    zone_id: str,
+    zone_id: Optional[str],
     artefact_resolver: Callable[[str], Optional[gsma_schemas.Artefact]],
 ) -> str:
     """
@@ -69,49 +65,67 @@ def generate_tosca_from_gsma_with_artefacts(  # noqa: C901
     :param artefact_resolver: Callable that returns an Artefact for a given artefactId
     :return: TOSCA YAML string (tosca_simple_yaml_1_3)
     """
-    node_templates: Dict[str, NodeTemplate] = {}
+    node_templates: Dict[str, Dict[str, Any]] = {}
+    # Artefacts are validated at ingress; resolve each one once per document
+    artefacts: Dict[str, Optional[gsma_schemas.Artefact]] = {}
+
+    # Host filter (basic example); identical for every component, so built once and
+    # shared (the dumper writes it inline rather than as a YAML alias)
+    host_props = host_properties("1024", zone_id)
+    host_requirement = {
+        "host": {"node_filter": {"capabilities": [{"host": {"properties": host_props}}]}}
+    }
 
     for comp in app_model.appComponentSpecs:
-        artefact = artefact_resolver(comp.artefactId)
+        artefact_id = comp.artefactId
+        if artefact_id in artefacts:
+            artefact = artefacts[artefact_id]
+        else:
+            artefact = artefacts[artefact_id] = artefact_resolver(artefact_id)
         if not artefact:
             raise ResourceNotFoundError(f"GSMA artefact '{comp.artefactId}' not found")
 
         # pick the componentSpec that matches componentName, else first
         comp_spec = None
-        if artefact.componentSpec:
-            for c in artefact.componentSpec:
-                if c.componentName == comp.componentName:
+        artefact_specs = artefact.componentSpec
+        if artefact_specs:
+            comp_name = comp.componentName
+            for c in artefact_specs:
+                if c.componentName == comp_name:
                     comp_spec = c
                     break
             if comp_spec is None:
-                comp_spec = artefact.componentSpec[0]
+                comp_spec = artefact_specs[0]
         else:
             raise InvalidArgumentError(f"Artefact '{artefact.artefactId}' has no componentSpec")
 
         # Resolve container image
-        image = comp_spec.images[0] if comp_spec.images else "docker.io/library/nginx:stable"
-        if "/" in image:
-            repository_url = "/".join(image.split("/")[:-1])
-            image_file = image.split("/")[-1]
-        else:
-            repository_url, image_file = "docker_hub", image
+        images = comp_spec.images
+        image = images[0] if images else "docker.io/library/nginx:stable"
+        repository_url, sep, image_file = image.rpartition("/")
+        if not sep:
+            repository_url = "docker_hub"
 
         # Ports (best-effort) from exposedInterfaces
-        ports: Dict[str, ExposedPort] = {}
+        ports: Dict[str, Dict[str, Any]] = {}
         expose_ports = False
-        if comp_spec.exposedInterfaces:
-            for idx, iface in enumerate(comp_spec.exposedInterfaces):
-                protocol = str(iface.get("protocol", "TCP")).lower()
+        exposed_interfaces = comp_spec.exposedInterfaces
+        if exposed_interfaces:
+            for idx, iface in enumerate(exposed_interfaces):
+                proto_raw = iface.get("protocol", "TCP")
+                protocol = _PROTO_MAP.get(proto_raw) if isinstance(proto_raw, str) else None
+                if protocol is None:
+                    protocol = str(proto_raw).lower()
                 port = iface.get("port")
                 if isinstance(port, int):
-                    ports[f"if{idx}"] = ExposedPort(
-                        properties=PortProperties(protocol=[protocol], source=port)
-                    )
+                    ports[f"if{idx}"] = {
+                        "properties": {"protocol": [protocol], "source": int(port)}
+                    }
                     expose_ports = True
 
         # Build cliArgs as a list of dicts: [{"KEY": "VAL"}, {"FLAG": ""}, ...]
         cli_args: List[Dict[str, str]] = []
-        cmd = getattr(comp_spec, "commandLineParams", None)
+        cmd = comp_spec.commandLineParams
 
         if isinstance(cmd, dict):
             for k, v in cmd.items():
@@ -133,8 +147,9 @@ def generate_tosca_from_gsma_with_artefacts(  # noqa: C901
 
         # Build envVars from compEnvParams list of {"name": "...", "value": "..."}
         env_vars: List[Dict[str, str]] = []
-        if isinstance(getattr(comp_spec, "compEnvParams", None), list):
-            for item in comp_spec.compEnvParams:
+        env_params = comp_spec.compEnvParams
+        if isinstance(env_params, list):
+            for item in env_params:
                 if isinstance(item, dict):
                     if "name" in item and "value" in item:
                         env_vars.append({str(item["name"]): str(item["value"])})
@@ -142,59 +157,34 @@ def generate_tosca_from_gsma_with_artefacts(  # noqa: C901
                         k, v = next(iter(item.items()))
                         env_vars.append({str(k): str(v)})
 
-        # Host filter (basic example)
-        host_props = HostProperty(
-            cpu_arch={"equal": "x64"},
-            realtime={"equal": False},
-            cpu_usage={"less_or_equal": "0.4"},
-            mem_size={"greater_or_equal": "1024"},
-            energy_efficiency={"greater_or_equal": "0"},
-            green={"greater_or_equal": "0"},
-            domain_id=DomainIdOperator(equal=zone_id),
-        )
-
         requirements = [
-            CustomRequirement(
-                network=NetworkRequirement(
-                    properties=NetworkProperties(ports=ports, exposePorts=expose_ports)
-                )
-            ),
-            CustomRequirement(
-                host=HostRequirement(
-                    node_filter=NodeFilter(
-                        capabilities=[{"host": HostCapability(properties=host_props)}],
-                        properties=None,
-                    )
-                )
-            ),
+            {"network": {"properties": {"ports": ports, "exposePorts": expose_ports}}},
+            host_requirement,
         ]
 
         # PUBLICREPO => is_private=False and omit credentials
-        repo_type = getattr(artefact, "repoType", None)
-        is_private = bool(repo_type == "PRIVATEREPO")
-        username = None
-        password = None
-        if is_private and artefact.artefactRepoLocation:
-            u = artefact.artefactRepoLocation.userName
-            p = artefact.artefactRepoLocation.password
-            username = u if u else None
-            password = p if p else None
-
-        node_templates[comp.componentName] = NodeTemplate(
-            type="tosca.nodes.Container.Application",
-            isJob=False,
-            requirements=requirements,
-            artifacts={
-                "application_image": ArtifactModel(
-                    file=image_file,
-                    type="tosca.artifacts.Deployment.Image.Container.Docker",
-                    repository=repository_url,
-                    is_private=is_private,  # False for PUBLICREPO
-                    username=username,  # None for PUBLICREPO
-                    password=password,  # None for PUBLICREPO
-                )
-            },
-            interfaces={
+        is_private = artefact.repoType == "PRIVATEREPO"
+        application_image = {
+            "file": image_file,
+            "type": "tosca.artifacts.Deployment.Image.Container.Docker",
+            "repository": repository_url,
+            "is_private": is_private,  # False for PUBLICREPO
+        }
+        repo_location = artefact.artefactRepoLocation
+        if is_private and repo_location:
+            u = repo_location.userName
+            p = repo_location.password
+            if u:
+                application_image["username"] = u
+            if p:
+                application_image["password"] = p
+
+        # continuum_models.NodeTemplate field order
+        node_templates[comp.componentName] = {
+            "type": "tosca.nodes.Container.Application",
+            "requirements": requirements,
+            "artifacts": {"application_image": application_image},
+            "interfaces": {
                 "Standard": {
                     "create": {
                         "implementation": "application_image",
@@ -205,22 +195,17 @@ def generate_tosca_from_gsma_with_artefacts(  # noqa: C901
                     }
                 }
             },
-        )
+            "isJob": False,
+        }
 
     # Assemble and dump TOSCA
-    tosca = TOSCA(
-        tosca_definitions_version="tosca_simple_yaml_1_3",
-        description=f"GSMA->TOSCA for {app_model.appMetaData.appName} ({app_model.appId})",
-        serviceOverlay=False,
-        node_templates=node_templates,
-    )
-
-    tosca_dict = tosca.model_dump(by_alias=True, exclude_none=True)
-    # Clean requirements lists from None entries
-    for template in tosca_dict.get("node_templates", {}).values():
-        template["requirements"] = [
-            {k: v for k, v in req.items() if v is not None}
-            for req in template.get("requirements", [])
-        ]
-
-    return yaml.dump(tosca_dict, sort_keys=False)
+    tosca_dict = {
+        "tosca_definitions_version": "tosca_simple_yaml_1_3",
+        "description": f"GSMA->TOSCA for {app_model.appMetaData.appName} ({app_model.appId})",
+        "serviceOverlay": False,
+        "node_templates": node_templates,
+    }
+    if config.VALIDATE_TOSCA:
+        TOSCA.model_validate(tosca_dict)
+
+    return dump_tosca(tosca_dict)
@@ -0,0 +1,51 @@
+"""
+Module: tosca_yaml.py
+YAML emission and host filter helpers shared by the CAMARA and GSMA
+-> TOSCA converters.
+"""
+
+from typing import Any, Dict, Optional
+
+import yaml
+
+try:  # LibYAML's C emitter when PyYAML was built with it
+    _YamlBaseDumper = yaml.CSafeDumper
+except AttributeError:
+    _YamlBaseDumper = yaml.SafeDumper
+
+
+class _ToscaDumper(_YamlBaseDumper):
+    """Dumper that writes shared sub-dicts inline instead of as YAML aliases."""
+
+    def ignore_aliases(self, data):
+        return True
+
+
+def dump_tosca(tosca_dict: dict) -> str:
+    """Emit the TOSCA document as a YAML string."""
+    return yaml.dump(tosca_dict, Dumper=_ToscaDumper, sort_keys=False)
+
+
+# Host filter constraints shared by every generated TOSCA (continuum_models.Property
+# field order); host_properties() copies it and sets only mem_size and domain_id
+_HOST_TEMPLATE = {
+    "cpu_usage": {"less_or_equal": 0.4},
+    "cpu_arch": {"equal": "x64"},
+    "mem_size": None,
+    "realtime": {"equal": False},
+    "energy_efficiency": {"greater_or_equal": "0"},
+    "green": {"greater_or_equal": "0"},
+    "domain_id": None,
+}
+
+
+def host_properties(mem_size: str, zone_id: Optional[str]) -> Dict[str, Any]:
+    """Node filter properties for a host with at least `mem_size` MB in `zone_id`.
+
+    An unresolved zone (None) leaves the domain_id constraint empty.
+    """
+    return {
+        **_HOST_TEMPLATE,
+        "mem_size": {"greater_or_equal": mem_size},
+        "domain_id": {"equal": zone_id} if zone_id is not None else {},
+    }
@@ -5,7 +5,7 @@
 #"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Union
 
 from sunrise6g_opensdk.edgecloud.core.camara_schemas import AppInstanceInfo
 from sunrise6g_opensdk.edgecloud.core.gsma_schemas import (
@@ -34,6 +34,11 @@ class AppStorageManager(ABC):
     def resolve_domain_id_by_zone_uuid(self, zone_uuid: str) -> Optional[str]:
         """Return the aerOS domain id (key) for a given edgeCloudZoneId (UUID)."""
 
+    def resolve_domain_ids_by_zone_uuids(self, zone_uuids: List[str]) -> List[Optional[str]]:
+        """Return the aerOS domain ids for several edgeCloudZoneIds, in the same order.
+        Backends should override this to resolve all of them in a single lookup."""
+        return [self.resolve_domain_id_by_zone_uuid(zone_uuid) for zone_uuid in zone_uuids]
+
     # ------------------------------------------------------------------------
     # CAMARA
     # ------------------------------------------------------------------------
@@ -62,6 +67,12 @@ class AppStorageManager(ABC):
     def store_deployment(self, app_instance: AppInstanceInfo) -> None:
         pass
 
+    def bulk_store_deployments(self, app_instances: Iterable[AppInstanceInfo]) -> None:
+        """Store several deployments.
+        Backends should override this to write them in a single transaction."""
+        for app_instance in app_instances:
+            self.store_deployment(app_instance)
+
     @abstractmethod
     def get_deployments(self, app_id: Optional[str] = None) -> Dict[str, List[str]]:
         pass
@@ -184,3 +195,17 @@ class AppStorageManager(ABC):
     def delete_artefact_gsma(self, artefact_id: str) -> None:
         """Implement in subclass."""
         raise NotImplementedError
+
+    def gsma_generation(self) -> Optional[int]:
+        """Counter that changes on every GSMA app/artefact write, for callers caching
+        data derived from those records. None (the default) means writes are not tracked,
+        e.g. because other processes share the store, so nothing should be cached."""
+        return None
+
+    def pop_artefact_gsma(self, artefact_id: str) -> Optional[Artefact]:
+        """Remove an artefact and return it, or None if it was not stored.
+        Backends should override this to do it in a single lookup."""
+        artefact = self.get_artefact_gsma(artefact_id)
+        if artefact is not None:
+            self.delete_artefact_gsma(artefact_id)
+        return artefact
@@ -1,12 +1,13 @@
 """
 Class: InMemoryAppStorage
-Process-wide singleton, thread-safe with a single RLock.
+Process-wide singleton, thread-safe with a reader/writer lock
+(concurrent readers, exclusive writers).
 Keeps CAMARA and GSMA stores separate to avoid schema confusion.
 """
 
 from abc import ABCMeta
-from threading import RLock
-from typing import Dict, List, Optional, Union
+from threading import Condition, Lock, RLock, get_ident
+from typing import Dict, List, Optional, Tuple, Union
 
 from sunrise6g_opensdk.edgecloud.adapters.aeros import config
 from sunrise6g_opensdk.edgecloud.adapters.aeros.storageManagement.appStorageManager import (
@@ -29,12 +30,104 @@ class SingletonMeta(ABCMeta):
     _lock = RLock()
 
     def __call__(cls, *args, **kwargs):
+        # Fast path: the instance is cached on the class itself (own __dict__ only,
+        # so subclasses get their own instance)
+        instance = cls.__dict__.get("_singleton")
+        if instance is not None:
+            return instance
         # Double-checked locking
-        if cls not in cls._instances:
-            with cls._lock:
-                if cls not in cls._instances:
-                    cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        with cls._lock:
+            instance = cls._instances.get(cls)
+            if instance is None:
+                instance = cls._instances[cls] = super().__call__(*args, **kwargs)
+            cls._singleton = instance
+        return instance
+
+
+class ReadWriteLock:
+    """
+    Reader/writer lock: any number of concurrent readers or a single writer.
+    Waiting writers block new readers, so a steady read load cannot starve them.
+    The writing thread may re-acquire either side (a write method calling another
+    locked method); a reader must not re-acquire or upgrade. `read` and `write` are
+    the context managers to use.
+    """
+
+    __slots__ = ("_cond", "_readers", "_owner", "_depth", "_writers_waiting", "read", "write")
+
+    def __init__(self):
+        self._cond = Condition(Lock())
+        self._readers = 0
+        self._owner: Optional[int] = None  # ident of the writing thread
+        self._depth = 0  # nested acquisitions held by the writing thread
+        self._writers_waiting = 0
+        self.read = _ReadGuard(self)
+        self.write = _WriteGuard(self)
+
+    def acquire_read(self) -> None:
+        me = get_ident()
+        with self._cond:
+            if self._owner == me:
+                self._depth += 1
+                return
+            while self._owner is not None or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        with self._cond:
+            if self._owner == get_ident():
+                self._depth -= 1
+                return
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        me = get_ident()
+        with self._cond:
+            if self._owner == me:
+                self._depth += 1
+                return
+            self._writers_waiting += 1
+            while self._owner is not None or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._owner = me
+            self._depth = 1
+
+    def release_write(self) -> None:
+        with self._cond:
+            self._depth -= 1
+            if not self._depth:
+                self._owner = None
+                self._cond.notify_all()
+
+
+class _ReadGuard:
+    __slots__ = ("_rw",)
+
+    def __init__(self, rw: ReadWriteLock):
+        self._rw = rw
+
+    def __enter__(self):
+        self._rw.acquire_read()
+
+    def __exit__(self, *exc):
+        self._rw.release_read()
+
+
+class _WriteGuard:
+    __slots__ = ("_rw",)
+
+    def __init__(self, rw: ReadWriteLock):
+        self._rw = rw
+
+    def __enter__(self):
+        self._rw.acquire_write()
+
+    def __exit__(self, *exc):
+        self._rw.release_write()
 
 
 class InMemoryAppStorage(AppStorageManager, metaclass=SingletonMeta):
@@ -52,22 +145,42 @@ class InMemoryAppStorage(AppStorageManager, metaclass=SingletonMeta):
         if config.DEBUG:
             self.logger.info("Using InMemoryStorage (singleton)")
 
-        self._lock = RLock()
+        self._rw = ReadWriteLock()
+        self._r = self._rw.read
+        self._w = self._rw.write
 
-        # aerOS Domain → Zone mapping
-        self._zones: Dict[str, Dict] = {}  # {aeros_domain_id: camara_zone_dict}
+        # aerOS Domain → Zone mapping. Writes accumulate in _zones_pending
+        # ({aeros_domain_id: camara_zone_dict}) and mark the published maps dirty; the
+        # first read after that republishes them (under the write lock), then readers
+        # use the published maps lock-free
+        self._zones_pending: Dict[str, Dict] = {}  # authoritative, changed under the lock
+        self._zones_dirty = False
+        self._domain_by_zone_uuid: Dict[str, str] = {}  # {edgeCloudZoneId: aeros_domain_id}
+        self._zones_snapshot: Tuple[Dict, ...] = ()  # shallow copies served by list_zones
 
         # CAMARA stores
         self._apps: Dict[str, Dict] = {}  # app_id -> manifest (CAMARA dict)
-        self._deployed: Dict[str, List[AppInstanceInfo]] = {}  # app_id -> [AppInstanceInfo]
-        self._stopped: Dict[str, List[str]] = {}  # app_id -> [stopped instance ids]
+        # shallow copies served by list_apps; rebuilt lazily after a write
+        self._apps_snapshot: Optional[Tuple[Dict, ...]] = None
+        # app_id -> {instance_id: AppInstanceInfo}
+        self._deployed: Dict[str, Dict[str, AppInstanceInfo]] = {}
+        # app_id -> stopped instance ids (dict keys as an insertion-ordered set)
+        self._stopped: Dict[str, Dict[str, None]] = {}
+        # instance_id -> app_id, for O(1) lookup/removal by instance id
+        self._inst_index: Dict[str, str] = {}
 
         # GSMA stores
         self._apps_gsma: Dict[str, ApplicationModel] = {}  # app_id -> ApplicationModel
-        self._deployed_gsma: Dict[str, List[AppInstance]] = {}  # app_id -> [AppInstance]
-        self._stopped_gsma: Dict[str, List[str]] = {}  # app_id -> [stopped instance ids]
+        # app_id -> {appInstIdentifier: AppInstance}
+        self._deployed_gsma: Dict[str, Dict[str, AppInstance]] = {}
+        self._stopped_gsma: Dict[str, Dict[str, None]] = {}  # app_id -> stopped instance ids
+        # appInstIdentifier -> app_id
+        self._inst_index_gsma: Dict[str, str] = {}
 
         self._artefacts_gsma: Dict[str, Artefact] = {}  # artefact_id -> Artefact
+        # Bumped (under the write lock, after the change) by every GSMA app/artefact
+        # store or actual removal
+        self._gsma_gen = 0
 
         self._initialized = True
 
@@ -76,15 +189,33 @@ class InMemoryAppStorage(AppStorageManager, metaclass=SingletonMeta):
     # ------------------------------------------------------------------------
     def reset(self) -> None:
         """Helper for tests to clear global state."""
-        with self._lock:
+        with self._w:
+            # Zones
+            self._zones_pending.clear()
+            self._zones_dirty = False
+            self._domain_by_zone_uuid = {}
+            self._zones_snapshot = ()
             # CAMARA
             self._apps.clear()
+            self._apps_snapshot = None
             self._deployed.clear()
             self._stopped.clear()
+            self._inst_index.clear()
             # GSMA
             self._apps_gsma.clear()
             self._deployed_gsma.clear()
             self._stopped_gsma.clear()
+            self._inst_index_gsma.clear()
+            self._artefacts_gsma.clear()
+            self._gsma_gen += 1
+
+    @staticmethod
+    def _pop_instance(deployed: Dict[str, Dict], app_id: str, instance_id: str) -> None:
+        """Drop one instance from an app bucket (and the bucket once empty); write lock held."""
+        insts = deployed[app_id]
+        insts.pop(instance_id, None)
+        if not insts:
+            del deployed[app_id]
 
     # ------------------------------------------------------------------------
     # aerOS Domain → Zone mapping
@@ -105,63 +236,99 @@ class InMemoryAppStorage(AppStorageManager, metaclass=SingletonMeta):
                 ...
             }
         """
-        with self._lock:
-            self._zones.update(zones)
+        with self._w:
+            self._zones_pending.update(zones)
+            self._zones_dirty = True
+
+    def _publish_zones(self) -> None:
+        """Rebuild the published zone maps if writes happened since the last rebuild."""
+        if not self._zones_dirty:
+            return
+        with self._w:
+            if not self._zones_dirty:
+                return
+            new_index: Dict[str, str] = {}
+            for domain_id, zone in self._zones_pending.items():
+                new_index.setdefault(zone.get("edgeCloudZoneId"), domain_id)
+            # Publish the index first so a reader never sees a zone it cannot resolve
+            self._domain_by_zone_uuid = new_index
+            self._zones_snapshot = tuple(dict(v) for v in self._zones_pending.values())
+            self._zones_dirty = False
 
     def list_zones(self) -> List[Dict]:
-        """Return all zone records as a list of dicts."""
-        with self._lock:
-            return [dict(v) for v in self._zones.values()]
+        """
+        Return all zone records as a list of dicts.
+        The dicts are shared between calls until the zones change; treat them as read-only.
+        """
+        self._publish_zones()
+        return list(self._zones_snapshot)
 
     def resolve_domain_id_by_zone_uuid(self, zone_uuid: str) -> Optional[str]:
         """
         Given the edgeCloudZoneId (UUID string), return the original aerOS domain id.
-        Performs a simple scan — fine for small to medium sets.
         """
-        with self._lock:
-            for domain_id, zone in self._zones.items():
-                if zone.get("edgeCloudZoneId") == zone_uuid:
-                    return domain_id
-            return None
+        self._publish_zones()
+        return self._domain_by_zone_uuid.get(zone_uuid)
+
+    def resolve_domain_ids_by_zone_uuids(self, zone_uuids: List[str]) -> List[Optional[str]]:
+        """
+        Resolve several edgeCloudZoneIds against one snapshot of the zone index.
+        Unknown ids resolve to None.
+        """
+        self._publish_zones()
+        domain_by_uuid = self._domain_by_zone_uuid
+        return [domain_by_uuid.get(zone_uuid) for zone_uuid in zone_uuids]
 
     # ------------------------------------------------------------------------
     # CAMARA
     # ------------------------------------------------------------------------
     def store_app(self, app_id: str, manifest: Dict) -> None:
-        with self._lock:
+        with self._w:
             self._apps[app_id] = manifest
+            self._apps_snapshot = None
+
+    # Single-key reads are one atomic dict operation against stores that writers only
+    # change by single-key assignment/pop, so they skip the read lock
 
     def get_app(self, app_id: str) -> Optional[Dict]:
-        with self._lock:
-            return self._apps.get(app_id)
+        return self._apps.get(app_id)
 
     def app_exists(self, app_id: str) -> bool:
-        with self._lock:
-            return app_id in self._apps
+        return app_id in self._apps
 
     def list_apps(self) -> List[Dict]:
-        with self._lock:
-            # shallow copies to avoid external mutation of nested dicts
-            return [dict(m) for m in self._apps.values()]
+        """
+        Return all CAMARA manifests as shallow copies.
+        The copies are shared between calls until the catalog changes; treat them as read-only.
+        """
+        with self._r:
+            snapshot = self._apps_snapshot
+            if snapshot is None:
+                # Writers are excluded here, so concurrent readers build identical snapshots
+                snapshot = self._apps_snapshot = tuple(dict(m) for m in self._apps.values())
+            return list(snapshot)
 
     def delete_app(self, app_id: str) -> None:
-        with self._lock:
+        with self._w:
             self._apps.pop(app_id, None)
+            self._apps_snapshot = None
 
     def store_deployment(self, app_instance: AppInstanceInfo) -> None:
-        with self._lock:
-            # Ensure the key is a plain string
-            aid = getattr(app_instance.appId, "root", str(app_instance.appId))
-            self._deployed.setdefault(aid, []).append(app_instance)
+        with self._w:
+            # AppInstanceInfo validates appId/appInstanceId as RootModels: key by .root
+            aid = str(app_instance.appId.root)
+            iid = str(app_instance.appInstanceId.root)
+            prev_aid = self._inst_index.get(iid)
+            if prev_aid is not None and prev_aid != aid:
+                self._pop_instance(self._deployed, prev_aid, iid)
+            self._deployed.setdefault(aid, {})[iid] = app_instance
+            self._inst_index[iid] = aid
 
     def get_deployments(self, app_id: Optional[str] = None) -> Dict[str, List[str]]:
-        with self._lock:
+        with self._r:
             if app_id:
-                ids = [str(i.appInstanceId) for i in self._deployed.get(app_id, [])]
-                return {app_id: ids}
-            return {
-                aid: [str(i.appInstanceId) for i in insts] for aid, insts in self._deployed.items()
-            }
+                return {app_id: list(self._deployed.get(app_id, ()))}
+            return {aid: list(insts) for aid, insts in self._deployed.items()}
 
     def find_deployments(
         self,
@@ -169,80 +336,69 @@ class InMemoryAppStorage(AppStorageManager, metaclass=SingletonMeta):
         app_instance_id: Optional[str] = None,
         region: Optional[str] = None,
     ) -> List[AppInstanceInfo]:
-        with self._lock:
+        with self._r:
             # Fast path by instance id
             if app_instance_id:
-                for insts in self._deployed.values():
-                    for inst in insts:
-                        if str(inst.appInstanceId.root) == app_instance_id:
-                            if app_id and str(inst.appId) != app_id:
-                                return []
-                            if region is not None and getattr(inst, "region", None) != region:
-                                return []
-                            return [inst]
-                return []
+                aid = self._inst_index.get(app_instance_id)
+                if aid is None or (app_id and aid != app_id):
+                    return []
+                inst = self._deployed[aid][app_instance_id]
+                if region is not None and getattr(inst, "region", None) != region:
+                    return []
+                return [inst]
 
             results: List[AppInstanceInfo] = []
             for aid, insts in self._deployed.items():
                 if app_id and aid != app_id:
                     continue
-                for inst in insts:
+                for inst in insts.values():
                     if region is not None and getattr(inst, "region", None) != region:
                         continue
                     results.append(inst)
             return results
 
     def remove_deployment(self, app_instance_id: str) -> Optional[str]:
-        with self._lock:
-            for aid, insts in list(self._deployed.items()):
-                for idx, inst in enumerate(insts):
-                    # Compare using the instance id string
-                    inst_id = getattr(inst.appInstanceId, "root", str(inst.appInstanceId))
-                    if inst_id == app_instance_id:
-                        insts.pop(idx)
-                        if not insts:
-                            self._deployed.pop(aid, None)
-                        # Return a plain string app_id
-                        aid_str = getattr(aid, "root", str(aid))
-                        return aid_str
-            return None
+        with self._w:
+            aid = self._inst_index.pop(app_instance_id, None)
+            if aid is not None:
+                self._pop_instance(self._deployed, aid, app_instance_id)
+            return aid
 
     def store_stopped_instance(self, app_id: str, app_instance_id: str) -> None:
-        with self._lock:
-            lst = self._stopped.setdefault(app_id, [])
-            if app_instance_id not in lst:
-                lst.append(app_instance_id)
+        with self._w:
+            self._stopped.setdefault(app_id, {})[app_instance_id] = None
 
     def get_stopped_instances(
         self, app_id: Optional[str] = None
     ) -> Union[List[str], Dict[str, List[str]]]:
-        with self._lock:
+        with self._r:
             if app_id:
-                return list(self._stopped.get(app_id, []))
+                return list(self._stopped.get(app_id, ()))
             return {aid: list(ids) for aid, ids in self._stopped.items()}
 
     def remove_stopped_instances(self, app_id: str) -> None:
-        with self._lock:
+        with self._w:
             self._stopped.pop(app_id, None)
 
     # ------------------------------------------------------------------------
     # GSMA
     # ------------------------------------------------------------------------
     def store_app_gsma(self, app_id: str, model: ApplicationModel) -> None:
-        with self._lock:
+        with self._w:
             self._apps_gsma[app_id] = model
+            self._gsma_gen += 1
 
     def get_app_gsma(self, app_id: str) -> Optional[ApplicationModel]:
-        with self._lock:
-            return self._apps_gsma.get(app_id)
+        return self._apps_gsma.get(app_id)
 
     def list_apps_gsma(self) -> List[ApplicationModel]:
-        with self._lock:
+        with self._r:
             return list(self._apps_gsma.values())
 
     def delete_app_gsma(self, app_id: str) -> None:
-        with self._lock:
-            self._apps_gsma.pop(app_id, None)
+        with self._w:
+            if self._apps_gsma.pop(app_id, None) is not None:
+                self._gsma_gen += 1
 
     def store_deployment_gsma(
         self,
@@ -250,20 +406,21 @@ class InMemoryAppStorage(AppStorageManager, metaclass=SingletonMeta):
         inst: AppInstance,
         status: Optional[AppInstanceStatus] = None,  # not persisted yet
     ) -> None:
-        with self._lock:
-            self._deployed_gsma.setdefault(app_id, []).append(inst)
+        with self._w:
+            iid = str(inst.appInstIdentifier)
+            prev_aid = self._inst_index_gsma.get(iid)
+            if prev_aid is not None and prev_aid != app_id:
+                self._pop_instance(self._deployed_gsma, prev_aid, iid)
+            self._deployed_gsma.setdefault(app_id, {})[iid] = inst
+            self._inst_index_gsma[iid] = app_id
             # If you later want to persist status per instance, keep a side map:
             # self._status_gsma[inst.appInstIdentifier] = status
 
     def get_deployments_gsma(self, app_id: Optional[str] = None) -> Dict[str, List[str]]:
-        with self._lock:
+        with self._r:
             if app_id:
-                ids = [str(i.appInstIdentifier) for i in self._deployed_gsma.get(app_id, [])]
-                return {app_id: ids}
-            return {
-                aid: [str(i.appInstIdentifier) for i in insts]
-                for aid, insts in self._deployed_gsma.items()
-            }
+                return {app_id: list(self._deployed_gsma.get(app_id, ()))}
+            return {aid: list(insts) for aid, insts in self._deployed_gsma.items()}
 
     def find_deployments_gsma(
         self,
@@ -271,77 +428,79 @@ class InMemoryAppStorage(AppStorageManager, metaclass=SingletonMeta):
         app_instance_id: Optional[str] = None,
         zone_id: Optional[str] = None,
     ) -> List[AppInstance]:
-        with self._lock:
-            # Limit the search space if app_id is provided
-            iter_lists = (
-                [self._deployed_gsma.get(app_id, [])] if app_id else self._deployed_gsma.values()
-            )
-
+        with self._r:
             # Fast path: instance id provided
             if app_instance_id:
                 target_id = str(app_instance_id)
-                for insts in iter_lists:
-                    for inst in insts:
-                        if str(inst.appInstIdentifier) != target_id:
-                            continue
-                        if zone_id is not None and inst.zoneId != zone_id:
-                            continue
-                        return [inst]
-                return []
-
-            # General filtering
+                aid = self._inst_index_gsma.get(target_id)
+                if aid is None or (app_id and aid != app_id):
+                    return []
+                inst = self._deployed_gsma[aid][target_id]
+                if zone_id is not None and inst.zoneId != zone_id:
+                    return []
+                return [inst]
+
+            # General filtering; limit the search space if app_id is provided
+            buckets = (
+                [self._deployed_gsma.get(app_id, {})] if app_id else self._deployed_gsma.values()
+            )
             results: List[AppInstance] = []
-            for insts in iter_lists:
-                for inst in insts:
+            for insts in buckets:
+                for inst in insts.values():
                     if zone_id is not None and inst.zoneId != zone_id:
                         continue
                     results.append(inst)
             return results
 
     def remove_deployment_gsma(self, app_instance_id: str) -> Optional[str]:
-        with self._lock:
-            for aid, insts in list(self._deployed_gsma.items()):
-                for idx, inst in enumerate(insts):
-                    if str(inst.appInstIdentifier) == app_instance_id:
-                        insts.pop(idx)
-                        if not insts:
-                            self._deployed_gsma.pop(aid, None)
-                        return aid
-            return None
+        with self._w:
+            aid = self._inst_index_gsma.pop(app_instance_id, None)
+            if aid is not None:
+                self._pop_instance(self._deployed_gsma, aid, app_instance_id)
+            return aid
 
     def store_stopped_instance_gsma(self, app_id: str, app_instance_id: str) -> None:
-        with self._lock:
-            lst = self._stopped_gsma.setdefault(app_id, [])
-            if app_instance_id not in lst:
-                lst.append(app_instance_id)
+        with self._w:
+            self._stopped_gsma.setdefault(app_id, {})[app_instance_id] = None
 
     def get_stopped_instances_gsma(
         self, app_id: Optional[str] = None
     ) -> Union[List[str], Dict[str, List[str]]]:
-        with self._lock:
+        with self._r:
             if app_id:
-                return list(self._stopped_gsma.get(app_id, []))
+                return list(self._stopped_gsma.get(app_id, ()))
             return {aid: list(ids) for aid, ids in self._stopped_gsma.items()}
 
     def remove_stopped_instances_gsma(self, app_id: str) -> None:
-        with self._lock:
+        with self._w:
             self._stopped_gsma.pop(app_id, None)
 
+    def gsma_generation(self) -> Optional[int]:
+        return self._gsma_gen
+
     # ------------------------------------------------------------------------
     # GSMA Artefacts
     # ------------------------------------------------------------------------
     def store_artefact_gsma(self, artefact: Artefact) -> None:
-        with self._lock:
+        with self._w:
             self._artefacts_gsma[artefact.artefactId] = artefact
+            self._gsma_gen += 1
 
     def get_artefact_gsma(self, artefact_id: str) -> Optional[Artefact]:
-        with self._lock:
-            return self._artefacts_gsma.get(artefact_id)
+        return self._artefacts_gsma.get(artefact_id)
 
     def list_artefacts_gsma(self) -> List[Artefact]:
-        with self._lock:
+        with self._r:
             return list(self._artefacts_gsma.values())
 
     def delete_artefact_gsma(self, artefact_id: str) -> None:
-        with self._lock:
-            self._artefacts_gsma.pop(artefact_id, None)
+        with self._w:
+            if self._artefacts_gsma.pop(artefact_id, None) is not None:
+                self._gsma_gen += 1
+
+    def pop_artefact_gsma(self, artefact_id: str) -> Optional[Artefact]:
+        with self._w:
+            artefact = self._artefacts_gsma.pop(artefact_id, None)
+            if artefact is not None:
+                self._gsma_gen += 1
+            return artefact
@@ -4,8 +4,11 @@ SQLite storage implementation
 
 import json
 import sqlite3
+import threading
 from functools import wraps
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from pydantic import TypeAdapter
 
 from sunrise6g_opensdk.edgecloud.adapters.aeros import config
 from sunrise6g_opensdk.edgecloud.adapters.aeros.storageManagement.appStorageManager import (
@@ -17,25 +20,72 @@ from sunrise6g_opensdk.edgecloud.core.camara_schemas import (
     AppInstanceInfo,
     AppInstanceName,
     AppProvider,
+    ComponentEndpointInfoItem,
     EdgeCloudZoneId,
     Status,
 )
 from sunrise6g_opensdk.logger import setup_logger
 
+try:
+    import orjson
+except ImportError:  # optional faster JSON codec (the "speedups" extra)
+    orjson = None
+
 decorator_logger = setup_logger()
 
 
+# Both codecs store the same compact text
+if orjson is not None:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+
+    _loads = orjson.loads
+else:
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    _loads = json.loads
+
+# Connection tuning: WAL lets readers run while a writer commits, NORMAL sync only
+# fsyncs at checkpoints, and the page cache / mmap keep the metadata in memory
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-65536",  # 64 MiB (negative = KiB)
+)
+
+# componentEndpointInfo holds pydantic models, which plain JSON encoders reject
+_ENDPOINT_INFO_ADAPTER = TypeAdapter(List[ComponentEndpointInfoItem])
+
+_INSERT_DEPLOYMENT = """
+    INSERT OR REPLACE INTO deployments (
+        app_instance_id, app_id, name, app_provider, status,
+        component_endpoint_info, kubernetes_cluster_ref, edge_cloud_zone_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?);
+"""
+
+
 def debug_log(msg: str):
     """
     Decorator that logs the given message if config.DEBUG is True.
+    config.DEBUG is checked once, when the method is decorated: with DEBUG off the
+    method is returned unwrapped.
     """
+    if not config.DEBUG:
+        return lambda func: func
 
     def decorator(func):
 
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if config.DEBUG:
-                decorator_logger.debug("[DEBUG] %s", msg)
+            decorator_logger.debug("[DEBUG] %s", msg)
             return func(*args, **kwargs)
 
         return wrapper
@@ -45,7 +95,9 @@ def debug_log(msg: str):
 
 class SQLiteAppStorage(AppStorageManager):
     """
-    SQLite storage implementation
+    SQLite storage implementation.
+    Each thread gets its own connection, so readers run concurrently against the WAL
+    instead of serialising on one shared connection.
     """
 
     @debug_log("Initializing SQLITE storage manager")
@@ -53,9 +105,29 @@ class SQLiteAppStorage(AppStorageManager):
         if config.DEBUG:
             self.logger = setup_logger()
             self.logger.info("DB Path: %s", db_path)
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.db_path = db_path
+        self._tls = threading.local()
+        # Every connection to ":memory:" is a separate database, so share a single one
+        self._shared_conn = self._connect() if db_path == ":memory:" else None
         self._init_schema()
 
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The calling thread's connection (opened on first use)."""
+        if self._shared_conn is not None:
+            return self._shared_conn
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            conn = self._tls.conn = self._connect()
+        return conn
+
     def _init_schema(self):
         if config.DEBUG:
             self.logger.info("Initializing db schema")
@@ -90,20 +162,34 @@ class SQLiteAppStorage(AppStorageManager):
         );
         """
         )
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_deployments_app_id ON deployments(app_id);")
+        # Databases created before the unique index may hold duplicate pairs
+        cursor.execute(
+            """
+        DELETE FROM stopped WHERE rowid NOT IN (
+            SELECT MIN(rowid) FROM stopped GROUP BY app_id, app_instance_id
+        );
+        """
+        )
+        # Also serves the app_id lookups (leading column)
+        cursor.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_stopped_pair "
+            "ON stopped(app_id, app_instance_id);"
+        )
         self.conn.commit()
 
     @debug_log("In SQLITE store_app method ")
     def store_app(self, app_id: str, manifest: Dict) -> None:
-        self.conn.execute(
-            "INSERT OR REPLACE INTO apps (app_id, manifest) VALUES (?, ?);",
-            (app_id, json.dumps(manifest)),
-        )
-        self.conn.commit()
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO apps (app_id, manifest) VALUES (?, ?);",
+                (app_id, _dumps(manifest)),
+            )
 
     @debug_log("In SQLITE get_app method ")
     def get_app(self, app_id: str) -> Optional[Dict]:
         row = self.conn.execute("SELECT manifest FROM apps WHERE app_id = ?;", (app_id,)).fetchone()
-        return json.loads(row[0]) if row else None
+        return _loads(row[0]) if row else None
 
     @debug_log("In SQLITE app_exists method ")
     def app_exists(self, app_id: str) -> bool:
@@ -113,50 +199,47 @@ class SQLiteAppStorage(AppStorageManager):
     @debug_log("In SQLITE list_apps method ")
     def list_apps(self) -> List[Dict]:
         rows = self.conn.execute("SELECT manifest FROM apps;").fetchall()
-        return [json.loads(row[0]) for row in rows]
+        return [_loads(row[0]) for row in rows]
 
     @debug_log("In SQLITE delete_app method ")
     def delete_app(self, app_id: str) -> None:
-        self.conn.execute("DELETE FROM apps WHERE app_id = ?;", (app_id,))
-        self.conn.commit()
+        with self.conn:
+            self.conn.execute("DELETE FROM apps WHERE app_id = ?;", (app_id,))
 
-    @debug_log("In SQLITE store_deployment method ")
-    def store_deployment(self, app_instance: AppInstanceInfo) -> None:
+    @staticmethod
+    def _deployment_row(app_instance: AppInstanceInfo) -> Tuple:
+        """Column values of a `deployments` row, in _INSERT_DEPLOYMENT order."""
         resolved_status = (
             str(app_instance.status.value)
             if hasattr(app_instance.status, "value")
             else str(app_instance.status) if app_instance.status else "unknown"
         )
-        self.logger.info("Resolved status for DB insert: %s", resolved_status)
-
-        self.conn.execute(
-            """
-            INSERT OR REPLACE INTO deployments (
-                app_instance_id, app_id, name, app_provider, status,
-                component_endpoint_info, kubernetes_cluster_ref, edge_cloud_zone_id
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?);
-            """,
-            (
-                str(app_instance.appInstanceId),
-                str(app_instance.appId),
-                str(app_instance.name.root),
-                str(app_instance.appProvider.root),
-                (
-                    str(app_instance.status.value)
-                    if hasattr(app_instance.status, "value")
-                    else str(app_instance.status) if app_instance.status else "unknown"
-                ),
-                (
-                    json.dumps(app_instance.componentEndpointInfo)
-                    if app_instance.componentEndpointInfo
-                    else None
-                ),
-                app_instance.kubernetesClusterRef,
-                str(app_instance.edgeCloudZoneId.root),
-            ),
+        # Most instances have no endpoints yet: skip the encoder for None/[]
+        endpoint_info = app_instance.componentEndpointInfo
+        return (
+            str(app_instance.appInstanceId.root),
+            str(app_instance.appId.root),
+            str(app_instance.name.root),
+            str(app_instance.appProvider.root),
+            resolved_status,
+            _ENDPOINT_INFO_ADAPTER.dump_json(endpoint_info).decode() if endpoint_info else None,
+            app_instance.kubernetesClusterRef,
+            str(app_instance.edgeCloudZoneId.root),
         )
 
-        self.conn.commit()
+    @debug_log("In SQLITE store_deployment method ")
+    def store_deployment(self, app_instance: AppInstanceInfo) -> None:
+        row = self._deployment_row(app_instance)
+        if config.DEBUG:
+            self.logger.info("Resolved status for DB insert: %s", row[4])
+        with self.conn:
+            self.conn.execute(_INSERT_DEPLOYMENT, row)
+
+    @debug_log("In SQLITE bulk_store_deployments method ")
+    def bulk_store_deployments(self, app_instances: Iterable[AppInstanceInfo]) -> None:
+        rows = [self._deployment_row(app_instance) for app_instance in app_instances]
+        with self.conn:
+            self.conn.executemany(_INSERT_DEPLOYMENT, rows)
 
     @debug_log("In SQLITE get_deployments method ")
     def get_deployments(self, app_id: Optional[str] = None) -> Dict[str, List[str]]:
@@ -179,7 +262,11 @@ class SQLiteAppStorage(AppStorageManager):
         app_instance_id: Optional[str] = None,
         region: Optional[str] = None,
     ) -> List[AppInstanceInfo]:
-        query = "SELECT * FROM deployments WHERE 1=1"
+        query = (
+            "SELECT app_instance_id, app_id, name, app_provider, status,"
+            " component_endpoint_info, kubernetes_cluster_ref, edge_cloud_zone_id"
+            " FROM deployments WHERE 1=1"
+        )
         params = []
         if app_id:
             query += " AND app_id = ?"
@@ -192,16 +279,18 @@ class SQLiteAppStorage(AppStorageManager):
 
         result = []
         for row in rows:
+            status = row["status"]
+            endpoint_info = row["component_endpoint_info"]
             result.append(
                 AppInstanceInfo(
-                    appInstanceId=AppInstanceId(row[0]),
-                    appId=AppId(row[1]),
-                    name=AppInstanceName(row[2]),
-                    appProvider=AppProvider(row[3]),
-                    status=Status(row[4]) if row[4] else Status.unknown,
-                    componentEndpointInfo=json.loads(row[5]) if row[5] else None,
-                    kubernetesClusterRef=row[6],
-                    edgeCloudZoneId=EdgeCloudZoneId(row[7]),
+                    appInstanceId=AppInstanceId(row["app_instance_id"]),
+                    appId=AppId(row["app_id"]),
+                    name=AppInstanceName(row["name"]),
+                    appProvider=AppProvider(row["app_provider"]),
+                    status=Status(status) if status else Status.unknown,
+                    componentEndpointInfo=_loads(endpoint_info) if endpoint_info else None,
+                    kubernetesClusterRef=row["kubernetes_cluster_ref"],
+                    edgeCloudZoneId=EdgeCloudZoneId(row["edge_cloud_zone_id"]),
                 )
             )
 
@@ -209,20 +298,22 @@ class SQLiteAppStorage(AppStorageManager):
 
     @debug_log("In SQLITE remove_deployments method ")
     def remove_deployment(self, app_instance_id: str) -> Optional[str]:
-        row = self.conn.execute(
-            "SELECT app_id FROM deployments WHERE app_instance_id = ?;", (app_instance_id,)
-        ).fetchone()
-        self.conn.execute("DELETE FROM deployments WHERE app_instance_id = ?;", (app_instance_id,))
-        self.conn.commit()
+        with self.conn:
+            row = self.conn.execute(
+                "SELECT app_id FROM deployments WHERE app_instance_id = ?;", (app_instance_id,)
+            ).fetchone()
+            self.conn.execute(
+                "DELETE FROM deployments WHERE app_instance_id = ?;", (app_instance_id,)
+            )
         return row[0] if row else None
 
     @debug_log("In SQLITE store_stopped_instance method ")
     def store_stopped_instance(self, app_id: str, app_instance_id: str) -> None:
-        self.conn.execute(
-            "INSERT INTO stopped (app_id, app_instance_id) VALUES (?, ?);",
-            (app_id, app_instance_id),
-        )
-        self.conn.commit()
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO stopped (app_id, app_instance_id) VALUES (?, ?);",
+                (app_id, app_instance_id),
+            )
 
     @debug_log("In SQLITE get_Stopped_instances method ")
     def get_stopped_instances(
@@ -242,5 +333,5 @@ class SQLiteAppStorage(AppStorageManager):
 
     @debug_log("In SQLITE remove_stopped_instances method ")
     def remove_stopped_instances(self, app_id: str) -> None:
-        self.conn.execute("DELETE FROM stopped WHERE app_id = ?;", (app_id,))
-        self.conn.commit()
+        with self.conn:
+            self.conn.execute("DELETE FROM stopped WHERE app_id = ?;", (app_id,))
@@ -8,22 +8,70 @@
 """
 aerOS help methods
 """
+import functools
+import re
 import string
 import uuid
-
-from requests.exceptions import HTTPError, RequestException, Timeout
+from typing import NoReturn
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import (
+    ChunkedEncodingError,
+    ContentDecodingError,
+    HTTPError,
+    ReadTimeout,
+    RequestException,
+    SSLError,
+    Timeout,
+)
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
+from urllib3.exceptions import SSLError as Urllib3SSLError
 
 import sunrise6g_opensdk.edgecloud.adapters.aeros.config as config
 import sunrise6g_opensdk.edgecloud.adapters.aeros.errors as errors
 from sunrise6g_opensdk.logger import setup_logger
 
-_HEX = "0123456789abcdef"
 _ALLOWED = set(
     string.ascii_letters + string.digits
 )  # no underscore here; underscore is always escaped
 _PREFIX = "A0_"  # ensures name starts with a letter; stripped during decode
 
 
+class _EncodeTable(dict):
+    """Char -> encoded form: allowed chars map to themselves, the rest to _hh (lowercase hex)."""
+
+    def __missing__(self, ch: str) -> str:
+        # code points above 255 are rare; escape them on demand without caching
+        return "_" + format(ord(ch), "02x")
+
+
+# '_' is not allowed, so it is escaped like any other byte ('_5f')
+_ENC_TABLE = _EncodeTable(
+    (chr(i), chr(i) if chr(i) in _ALLOWED else f"_{i:02x}") for i in range(256)
+)
+_encode_char = _ENC_TABLE.__getitem__
+
+_ESCAPE_RE = re.compile(r"_[0-9a-fA-F]{2}")
+# "_hh" (either hex case) -> decoded char
+_DEC_TABLE = {
+    f"_{h1}{h2}": chr(int(h1 + h2, 16)) for h1 in string.hexdigits for h2 in string.hexdigits
+}
+# an underscore that does not start a valid _hh escape
+_BAD_ESCAPE_RE = re.compile(r"_(?![0-9a-fA-F]{2})")
+
+# Shared by every function decorated with catch_requests_exceptions
+_LOGGER = setup_logger(__name__, is_debug=True, file_name=config.LOG_FILE)
+
+# HTTP status -> (error class, message) raised by catch_requests_exceptions
+_STATUS_MAP = {
+    401: (errors.UnauthenticatedError, "Unauthorized access"),
+    403: (errors.PermissionDeniedError, "Forbidden access"),
+    404: (errors.ResourceNotFoundError, "Resource not found"),
+    400: (errors.InvalidArgumentError, "Bad request"),
+    503: (errors.ServiceUnavailableError, "Service unavailable"),
+}
+
+
 def encode_app_instance_name(original: str, *, max_len: int = 64) -> str:
     """
     aerOS to CAMARA AppInstanceName encoder.
@@ -31,21 +79,14 @@ def encode_app_instance_name(original: str, *, max_len: int = 64) -> str:
     Uses underscore + two hex digits to escape any non [A-Za-z0-9] chars, including '_' itself.
     If the encoded result would exceed `max_len`, raise ValueError (reversibility would be lost otherwise).
     """
-    out = []
-    for ch in original:
-        if ch in _ALLOWED:
-            out.append(ch)
-        elif ch == "_":
-            out.append("_5f")
-        else:
-            # escape any other byte as _hh (lowercase hex)
-            out.append("_" + format(ord(ch), "02x"))
-
-    enc = "".join(out)
-
-    # must start with a letter
-    if not enc or enc[0] not in string.ascii_letters:
-        enc = _PREFIX + enc
+    if original.isascii() and original.isalnum():
+        # already conforming: nothing to escape, only the leading letter to ensure
+        enc = original if original[0].isalpha() else _PREFIX + original
+    else:
+        enc = "".join(map(_encode_char, original))
+        # must start with a letter
+        if not enc or enc[0] not in string.ascii_letters:
+            enc = _PREFIX + enc
 
     if len(enc) > max_len:
         raise ValueError(
@@ -63,35 +104,37 @@ def decode_app_instance_name(encoded: str) -> str:
     if s.startswith(_PREFIX):
         s = s[len(_PREFIX) :]
 
-    # walk and decode _hh sequences; underscores never appear unescaped in the encoding
-    i = 0
-    out = []
-    while i < len(s):
-        ch = s[i]
-        if ch != "_":
-            out.append(ch)
-            i += 1
-            continue
-
-        # expect two hex digits after underscore
+    if "_" not in s:
+        return s
+
+    # underscores never appear unescaped in the encoding
+    bad = _BAD_ESCAPE_RE.search(s)
+    if bad is not None:
+        i = bad.start()
         if i + 2 >= len(s):
             raise ValueError("Invalid escape at end of string.")
-        h1 = s[i + 1].lower()
-        h2 = s[i + 2].lower()
-        if h1 not in _HEX or h2 not in _HEX:
-            raise ValueError(f"Invalid escape sequence: _{h1}{h2}")
-        code = int(h1 + h2, 16)
-        out.append(chr(code))
-        i += 3
+        raise ValueError(f"Invalid escape sequence: {s[i:i + 3].lower()}")
 
-    return "".join(out)
+    return _ESCAPE_RE.sub(lambda m: _DEC_TABLE[m[0]], s)
 
 
+@functools.lru_cache(maxsize=4096)
 def urn_to_uuid(urn: str) -> uuid.UUID:
-    """Convert a (ngsi-ld) URN string to a deterministic UUID."""
+    """Convert a (ngsi-ld) URN string to a deterministic UUID.
+    Memoized: aerOS domain URNs are stable across queries and UUIDs are immutable."""
     return uuid.uuid5(uuid.NAMESPACE_URL, urn)
 
 
+# aerOS service actionType -> GSMA appInstanceState
+_AEROS_TO_GSMA_STATUS = {
+    "DEPLOYING": "PENDING",
+    "DESTROYING": "TERMINATING",
+    "DEPLOYED": "DEPLOYED",
+    "FINISHED": "READY",
+    # "urn:ngsi-ld:null": "READY",
+}
+
+
 def map_aeros_service_status_to_gsma(status: str) -> str:
     """
     Map aerOS service lifecycle states to GSMA-compliant status values.
@@ -104,74 +147,98 @@ def map_aeros_service_status_to_gsma(status: str) -> str:
       No_Match        → READY
       urn:ngsi-ld:null → No Match
     """
-    mapping = {
-        "DEPLOYING": "PENDING",
-        "DESTROYING": "TERMINATING",
-        "DEPLOYED": "DEPLOYED",
-        "FINISHED": "READY",
-        # "urn:ngsi-ld:null": "READY",
-    }
     if not status:
         return "FAILED"
-    return mapping.get(status.strip().upper(), "FAILED")
+    # aerOS already reports upper-case tokens; normalise only on a miss
+    gsma_status = _AEROS_TO_GSMA_STATUS.get(status)
+    if gsma_status is None:
+        gsma_status = _AEROS_TO_GSMA_STATUS.get(status.strip().upper(), "FAILED")
+    return gsma_status
+
+
+def _translate_request_exception(e: Exception) -> NoReturn:
+    """
+    Log a requests (or connection) exception and re-raise it as the matching app error.
+    """
+    logger = _LOGGER
+
+    if isinstance(e, HTTPError):
+        # requests always sets .response on its exceptions (None if there was none)
+        response = e.response
+        status_code = response.status_code if response is not None else None
+        logger.error("HTTPError occurred: %s", e)
+
+        mapped = _STATUS_MAP.get(status_code)
+        if mapped is not None:
+            error_cls, message = mapped
+            raise error_cls(message) from e
+
+        raise errors.EdgeCloudPlatformError(f"Unhandled HTTP error: {status_code}") from e
+
+    if isinstance(e, Timeout):
+        logger.warning("Timeout occurred: %s", e)
+        raise errors.ServiceUnavailableError("Request timed out") from e
+
+    if isinstance(e, (RequestsConnectionError, ConnectionError)):
+        logger.warning("Connection error (e.g., DNS): %s", e)
+        raise errors.ServiceUnavailableError("Connection issue") from e
+
+    # Catch other unclassified request exceptions (non-HTTP)
+    logger.error("Request failed: %s", str(e))
+
+    if e.response is not None:
+        logger.error("Status Code: %s", e.response.status_code)
+        logger.error("Response Body (raw): %s", e.response.text)
+
+        try:
+            json_data = e.response.json()
+            logger.debug("Parsed JSON response: %s", json_data)
+        except ValueError:
+            logger.warning("Response body is not valid JSON.")
+
+    if e.request is not None:
+        logger.error("Request URL: %s", e.request.url)
+        logger.error("Request Method: %s", e.request.method)
+        logger.error("Request Headers: %s", e.request.headers)
+        logger.error("Request Body: %s", e.request.body)
+
+    raise errors.EdgeCloudPlatformError("Unhandled request error") from e
+
+
+# urllib3 errors raised while reading a streamed body (response.raw) -> the requests
+# exception requests itself raises for them when it reads the body
+_STREAM_ERROR_MAP = (
+    (ReadTimeoutError, ReadTimeout),
+    (ProtocolError, ChunkedEncodingError),
+    (DecodeError, ContentDecodingError),
+    (Urllib3SSLError, SSLError),
+)
+STREAM_ERRORS = tuple(urllib3_cls for urllib3_cls, _ in _STREAM_ERROR_MAP)
+
+
+def translate_stream_exception(e: Exception, request=None) -> NoReturn:
+    """
+    Re-raise a urllib3 error hit while reading response.raw as the matching app error,
+    like catch_requests_exceptions does for errors raised inside the request call.
+    """
+    for urllib3_cls, requests_cls in _STREAM_ERROR_MAP:
+        if isinstance(e, urllib3_cls):
+            wrapped = requests_cls(e, request=request)
+            wrapped.__cause__ = e
+            _translate_request_exception(wrapped)
+    raise e
 
 
 def catch_requests_exceptions(func):
     """
     Decorator to catch and translate requests exceptions into custom app errors.
     """
-    logger = setup_logger(__name__, is_debug=True, file_name=config.LOG_FILE)
 
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-
-        except HTTPError as e:
-            response = getattr(e, "response", None)
-            status_code = getattr(response, "status_code", None)
-            logger.error("HTTPError occurred: %s", e)
-
-            if status_code == 401:
-                raise errors.UnauthenticatedError("Unauthorized access") from e
-            elif status_code == 403:
-                raise errors.PermissionDeniedError("Forbidden access") from e
-            elif status_code == 404:
-                raise errors.ResourceNotFoundError("Resource not found") from e
-            elif status_code == 400:
-                raise errors.InvalidArgumentError("Bad request") from e
-            elif status_code == 503:
-                raise errors.ServiceUnavailableError("Service unavailable") from e
-
-            raise errors.EdgeCloudPlatformError(f"Unhandled HTTP error: {status_code}") from e
-
-        except Timeout as e:
-            logger.warning("Timeout occurred: %s", e)
-            raise errors.ServiceUnavailableError("Request timed out") from e
-
-        except ConnectionError as e:
-            logger.warning("Connection error (e.g., DNS): %s", e)
-            raise errors.ServiceUnavailableError("Connection issue") from e
-
-        except RequestException as e:
-            # Catch other unclassified request exceptions (non-HTTP)
-            logger.error("Request failed: %s", str(e))
-
-            if e.response is not None:
-                logger.error("Status Code: %s", e.response.status_code)
-                logger.error("Response Body (raw): %s", e.response.text)
-
-                try:
-                    json_data = e.response.json()
-                    logger.debug("Parsed JSON response: %s", json_data)
-                except ValueError:
-                    logger.warning("Response body is not valid JSON.")
-
-            if e.request is not None:
-                logger.error("Request URL: %s", e.request.url)
-                logger.error("Request Method: %s", e.request.method)
-                logger.error("Request Headers: %s", e.request.headers)
-                logger.error("Request Body: %s", e.request.body)
-
-            raise errors.EdgeCloudPlatformError("Unhandled request error") from e
+        except (RequestException, ConnectionError) as e:
+            _translate_request_exception(e)
 
     return wrapper
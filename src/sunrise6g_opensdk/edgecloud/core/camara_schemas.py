@@ -9,11 +9,13 @@ from ipaddress import IPv4Address, IPv6Address
 from typing import List, Literal, Optional, Union
 from uuid import UUID
 
-from pydantic import BaseModel, Field, RootModel, conint, constr
+from pydantic import BaseModel, ConfigDict, Field, RootModel, conint, constr
 
 
 # FIXME: RootModel should only accept UUID. Limitation coming from i2Edge
 class AppId(RootModel[Union[UUID, str]]):
+    model_config = ConfigDict(frozen=True)
+
     root: Union[UUID, str] = Field(
         ...,
         description="A globally unique identifier associated with the application.\nEdge Cloud Platform generates this identifier when the\nApplication is submitted.\n",
@@ -37,6 +39,8 @@ class Status(Enum):
 
 
 class AppInstanceName(RootModel[constr(pattern=r"^[A-Za-z][A-Za-z0-9_]{1,63}$")]):  # type: ignore
+    model_config = ConfigDict(frozen=True)
+
     root: constr(pattern=r"^[A-Za-z][A-Za-z0-9_]{1,63}$") = Field(
         ..., description="Name of the App instance, scoped to the AppProvider"
     )
@@ -101,6 +105,8 @@ class ComponentSpecItem(BaseModel):
 
 
 class AppProvider(RootModel[constr(pattern=r"^[A-Za-z][A-Za-z0-9_]{7,63}$")]):
+    model_config = ConfigDict(frozen=True)
+
     root: constr(pattern=r"^[A-Za-z][A-Za-z0-9_]{7,63}$") = Field(
         ..., description="Human readable name of the Application Provider."
     )
@@ -118,6 +124,8 @@ class EdgeCloudRegion(RootModel[str]):
 
 
 class EdgeCloudZoneId(RootModel[UUID]):
+    model_config = ConfigDict(frozen=True)
+
     root: UUID = Field(
         ...,
         description="Unique identifier created by the Edge Cloud Platform to identify an\nEdge Cloud Zone within an Edge Cloud.\n",
@@ -474,6 +482,8 @@ class RequiredResources(
 
 
 class SubmittedApp(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     appId: Optional[AppId] = None
 
 
@@ -534,6 +544,8 @@ class ComponentEndpointInfoItem(BaseModel):
 
 
 class AppInstanceInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: AppInstanceName
     appId: AppId
     appInstanceId: AppInstanceId
@@ -7,13 +7,74 @@
 #   - César Cajas (cesar.cajas@i2cat.net)
 ##
 import json
+import math
+import uuid
+from enum import Enum
 
 from requests import Response
 
 from sunrise6g_opensdk import logger
 
+try:
+    import orjson
+except ImportError:  # optional faster JSON encoder (the "speedups" extra)
+    orjson = None
+
 log = logger.get_logger(__name__)
 
+_UTF8_ENCODINGS = ("utf-8", "utf8")
+# orjson refuses these like json.dumps does, instead of serializing them its own way
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
+
+def _json_default(obj):
+    """json.dumps hook serializing the extra types orjson handles natively."""
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _nan_to_null(obj):
+    """Copy of obj with NaN and +/-Infinity floats replaced by None, as orjson writes them."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _nan_to_null(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_nan_to_null(v) for v in obj]
+    return obj
+
+
+def _dumps_utf8(content) -> bytes:
+    """Compact UTF-8 JSON. UUID values become strings, Enum members their value and
+    NaN/Infinity null on both the orjson and the json fallback path; other unsupported
+    types raise TypeError. The bytes match except for the exponent spelling of very
+    large or small floats (e.g. 1e+300 vs 1e300)."""
+    if orjson is not None:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
+    try:
+        text = json.dumps(
+            content,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            allow_nan=False,
+            default=_json_default,
+        )
+    except ValueError:  # non-finite float somewhere; rare, so only then copy and retry
+        text = json.dumps(
+            _nan_to_null(content),
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=_json_default,
+        )
+    return text.encode("utf-8")
+
 
 def build_custom_http_response(
     status_code: int,
@@ -26,7 +87,10 @@ def build_custom_http_response(
     response = Response()
     response.status_code = status_code
     if isinstance(content, (dict, list)):
-        content = json.dumps(content)
+        if (encoding or "utf-8").lower() in _UTF8_ENCODINGS:
+            content = _dumps_utf8(content)
+        else:
+            content = json.dumps(content)
     response._content = content.encode(encoding or "utf-8") if isinstance(content, str) else content
     response.headers.update(headers or {})
     response.encoding = encoding or "utf-8"
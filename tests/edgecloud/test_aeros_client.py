@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+aerOS client unit tests
+
+The streamed (ijson) InfrastructureElement query behind the GSMA zone handlers,
+run against canned aerOS responses instead of a live continuum.
+"""
+import gzip
+import io
+import json
+
+import pytest
+import requests
+from urllib3 import HTTPResponse
+
+from sunrise6g_opensdk.edgecloud.adapters.aeros import config
+from sunrise6g_opensdk.edgecloud.adapters.aeros.client import EdgeApplicationManager
+from sunrise6g_opensdk.edgecloud.adapters.errors import EdgeCloudPlatformError
+
+pytest.importorskip("ijson")
+
+API_URL = "http://aeros.invalid"
+
+IES = [
+    {"id": "urn:ngsi-ld:IE:1", "domain": "urn:ngsi-ld:Domain:d1", "cpuCores": 2, "hostname": "h1"},
+    {"id": "urn:ngsi-ld:IE:2", "domain": "urn:ngsi-ld:Domain:d2", "cpuCores": 4, "hostname": "h2"},
+    {"id": "urn:ngsi-ld:IE:3", "domain": "urn:ngsi-ld:Domain:d1", "cpuCores": 8, "hostname": "h3"},
+]
+
+
+class _ResetAfter(io.BytesIO):
+    """Body that drops the connection after its first `size` bytes."""
+
+    def __init__(self, data: bytes, size: int):
+        super().__init__(data[:size])
+
+    def read(self, *args):
+        chunk = super().read(*args)
+        if not chunk:
+            raise ConnectionResetError("connection reset by peer")
+        return chunk
+
+
+def _response(url, status=200, body=b"", headers=None, fp=None):
+    """A streamed requests.Response whose raw body is read from memory."""
+    response = requests.Response()
+    response.status_code = status
+    response.url = url
+    response.request = requests.Request("GET", url).prepare()
+    response.raw = HTTPResponse(
+        body=fp if fp is not None else io.BytesIO(body),
+        headers=headers or {},
+        status=status,
+        preload_content=False,
+        decode_content=False,
+    )
+    return response
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(config, "aerOS_API_URL", API_URL)
+    monkeypatch.setattr(config, "aerOS_ACCESS_TOKEN", "token")
+    monkeypatch.setattr(config, "aerOS_HLO_TOKEN", "token")
+    return EdgeApplicationManager(API_URL)
+
+
+@pytest.fixture
+def aeros(manager, monkeypatch):
+    """Queue of canned responses served to the continuum client; records the URLs."""
+    queue = []
+    urls = []
+
+    def get(url, **kwargs):
+        assert kwargs.get("stream") is True
+        urls.append(url)
+        return _response(url, **queue.pop(0))
+
+    monkeypatch.setattr(manager._get_continuum_client()._session, "get", get)
+    return queue, urls
+
+
+def test_zones_are_grouped_by_domain(manager, aeros):
+    """Streamed IEs are aggregated into one GSMA zone per aerOS domain"""
+    queue, urls = aeros
+    queue.append({"body": json.dumps(IES).encode()})
+
+    response = manager.get_edge_cloud_zones_gsma()
+
+    assert response.status_code == 200
+    zones = {zone["zoneId"]: zone for zone in response.json()}
+    assert set(zones) == {"urn:ngsi-ld:Domain:d1", "urn:ngsi-ld:Domain:d2"}
+    assert zones["urn:ngsi-ld:Domain:d1"]["computeResourceQuotaLimits"][0]["numCPU"] == 10
+    assert len(zones["urn:ngsi-ld:Domain:d1"]["flavoursSupported"]) == 2
+    assert "q=" not in urls[0]
+
+
+def test_gzip_body_is_decoded(manager, aeros):
+    """A gzip-encoded body is decompressed before parsing"""
+    queue, _ = aeros
+    queue.append(
+        {"body": gzip.compress(json.dumps(IES).encode()), "headers": {"Content-Encoding": "gzip"}}
+    )
+
+    response = manager.get_edge_cloud_zones_gsma()
+
+    assert len(response.json()) == 2
+
+
+def test_single_zone_query_filters_by_domain(manager, aeros):
+    """A per-zone query sends the domain q= filter and keeps IEs without a domain field"""
+    queue, urls = aeros
+    zone_id = "urn:ngsi-ld:Domain:d1"
+    ies = [{k: v for k, v in ie.items() if k != "domain"} for ie in IES if ie["domain"] == zone_id]
+    queue.append({"body": json.dumps(ies).encode()})
+
+    response = manager.get_edge_cloud_zone_details_gsma(zone_id)
+
+    assert f'q=domain=="{zone_id}"' in urls[0]
+    assert response.json()["zoneId"] == zone_id
+    assert response.json()["computeResourceQuotaLimits"][0]["numCPU"] == 10
+
+
+def test_error_response_is_empty_and_not_cached(manager, aeros):
+    """A non-2xx response yields no zones, and the next call queries aerOS again"""
+    queue, urls = aeros
+    queue.append({"status": 500, "body": b'{"error": "internal"}'})
+    queue.append({"body": json.dumps(IES).encode()})
+
+    response = manager.get_edge_cloud_zones_gsma()
+    assert response.status_code == 500
+    assert response.json() == []
+
+    response = manager.get_edge_cloud_zones_gsma()
+    assert len(urls) == 2
+    assert len(response.json()) == 2
+
+
+def test_successful_response_is_cached(manager, aeros):
+    """A successful continuum-wide result serves the next lookups"""
+    queue, urls = aeros
+    queue.append({"body": json.dumps(IES).encode()})
+
+    manager.get_edge_cloud_zones_gsma()
+    response = manager.get_edge_cloud_zone_details_gsma("urn:ngsi-ld:Domain:d2")
+
+    assert len(urls) == 1
+    assert response.json()["zoneId"] == "urn:ngsi-ld:Domain:d2"
+
+
+def test_truncated_json_raises_decode_error(manager, aeros):
+    """A body cut off mid-document raises JSONDecodeError"""
+    queue, _ = aeros
+    queue.append({"body": json.dumps(IES).encode()[:-20]})
+
+    with pytest.raises(json.JSONDecodeError):
+        manager.get_edge_cloud_zones_gsma()
+
+
+def test_dropped_connection_raises_platform_error(manager, aeros):
+    """A connection lost while the body is read becomes the adapter's error"""
+    queue, _ = aeros
+    body = json.dumps(IES).encode()
+    queue.append({"fp": _ResetAfter(body, len(body) // 2)})
+
+    with pytest.raises(EdgeCloudPlatformError) as exc_info:
+        manager.get_edge_cloud_zones_gsma()
+    assert isinstance(exc_info.value.__cause__, requests.exceptions.ChunkedEncodingError)
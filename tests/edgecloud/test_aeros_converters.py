@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+aerOS TOSCA converters snapshot tests
+
+Pins the YAML produced by camara2aeros_converter and gsma2aeros_converter
+for a few representative CAMARA manifests and GSMA app/artefact pairs.
+The snapshots in snapshots/ hold the exact (byte-for-byte) output; a
+change that alters the generated TOSCA must update them on purpose.
+"""
+import copy
+from pathlib import Path
+
+import pytest
+
+from sunrise6g_opensdk.edgecloud.adapters.aeros.converters import (
+    camara2aeros_converter,
+    gsma2aeros_converter,
+)
+from sunrise6g_opensdk.edgecloud.core import camara_schemas, gsma_schemas
+from tests.edgecloud.test_config_gsma import CONFIG
+
+SNAPSHOT_DIR = Path(__file__).parent / "snapshots"
+
+ZONE_ID = "urn:ngsi-ld:Domain:d0"
+
+CAMARA_MANIFEST = {
+    "appId": "app-1",
+    "name": "aeros_SDK_app",
+    "version": "1.0.0",
+    "appProvider": "aerOS_SDK",
+    "packageType": "CONTAINER",
+    "appRepo": {"type": "PUBLICREPO", "imagePath": "docker.io/library/nginx:latest"},
+    "requiredResources": {
+        "infraKind": "kubernetes",
+        "applicationResources": {
+            "cpuPool": {
+                "numCPU": 2,
+                "memory": 2048,
+                "topology": {"minNumberOfNodes": 1, "minNodeCpu": 1, "minNodeMemory": 512},
+            }
+        },
+        "isStandalone": False,
+        "version": "1.29",
+    },
+    "componentSpec": [
+        {
+            "componentName": "comp",
+            "networkInterfaces": [
+                {
+                    "interfaceId": "eth0",
+                    "protocol": "TCP",
+                    "port": 8080,
+                    "visibilityType": "VISIBILITY_EXTERNAL",
+                }
+            ],
+        }
+    ],
+}
+
+
+def _camara_private_repo():
+    manifest = copy.deepcopy(CAMARA_MANIFEST)
+    manifest["appRepo"] = {
+        "type": "PRIVATEREPO",
+        "imagePath": "https://reg.example.com:5000/a/b/img:1",
+        "userName": "u",
+        "credentials": "p",
+    }
+    manifest["componentSpec"][0]["networkInterfaces"] = [
+        {
+            "interfaceId": "eth0",
+            "protocol": "UDP",
+            "port": 53,
+            "visibilityType": "VISIBILITY_INTERNAL",
+        },
+        {
+            "interfaceId": "eth1",
+            "protocol": "ANY",
+            "port": 443,
+            "visibilityType": "VISIBILITY_EXTERNAL",
+        },
+    ]
+    return manifest
+
+
+def _camara_standalone():
+    manifest = copy.deepcopy(CAMARA_MANIFEST)
+    manifest["requiredResources"]["isStandalone"] = True
+    topology = manifest["requiredResources"]["applicationResources"]["cpuPool"]["topology"]
+    topology["minNodeMemory"] = 4096
+    return manifest
+
+
+CAMARA_CASES = {
+    "camara_public_repo": (CAMARA_MANIFEST, [ZONE_ID]),
+    "camara_private_repo_two_zones": (_camara_private_repo(), ["z1", "z2"]),
+    "camara_standalone": (_camara_standalone(), [ZONE_ID]),
+    "camara_unresolved_zone": (CAMARA_MANIFEST, [None]),
+}
+
+
+def _gsma_app_model(app: dict) -> gsma_schemas.ApplicationModel:
+    fields = {k: v for k, v in app.items() if k not in ("appStatusCallbackLink", "edgeAppFQDN")}
+    fields["appDeploymentZones"] = [
+        {"countryCode": "XX", "zoneInfo": zone} for zone in app["appDeploymentZones"]
+    ]
+    fields["onboardStatusInfo"] = "ONBOARDED"
+    return gsma_schemas.ApplicationModel.model_validate(fields)
+
+
+def _gsma_private_artefact():
+    artefact = copy.deepcopy(CONFIG["aeros"]["ARTEFACT_PAYLOAD_GSMA"])
+    artefact["repoType"] = "PRIVATEREPO"
+    artefact["artefactRepoLocation"] = {"repoURL": "r", "userName": "user", "password": ""}
+    spec = artefact["componentSpec"][0]
+    spec["commandLineParams"] = {"--v": True, "--q": False, "--n": None, "x": 3}
+    spec["exposedInterfaces"] = [
+        {"protocol": "udp", "port": 53},
+        {"port": 80},
+        {"protocol": "Sctp", "port": 9},
+    ]
+    spec["compEnvParams"] = [{"A": 1}, {"name": "B", "value": 2}]
+    return artefact
+
+
+def _gsma_two_components():
+    app = copy.deepcopy(CONFIG["aeros"]["APP_ONBOARD_MANIFEST_GSMA"])
+    first = copy.deepcopy(CONFIG["aeros"]["ARTEFACT_PAYLOAD_GSMA"])
+    second = copy.deepcopy(first)
+    second["artefactId"] = "second"
+    second["componentSpec"][0]["commandLineParams"] = {"k": "v"}
+    specs = app["appComponentSpecs"]
+    specs.append(dict(specs[0], componentName="c2", artefactId="second"))
+    return app, [first, second]
+
+
+GSMA_CASES = {
+    "gsma_config_artefact": (
+        CONFIG["aeros"]["APP_ONBOARD_MANIFEST_GSMA"],
+        [CONFIG["aeros"]["ARTEFACT_PAYLOAD_GSMA"]],
+    ),
+    "gsma_private_artefact": (
+        CONFIG["aeros"]["APP_ONBOARD_MANIFEST_GSMA"],
+        [_gsma_private_artefact()],
+    ),
+    "gsma_two_components": _gsma_two_components(),
+}
+
+
+def camara_tosca(name: str):
+    manifest, zones = CAMARA_CASES[name]
+    app_manifest = camara_schemas.AppManifest.model_validate(manifest)
+    return camara2aeros_converter.generate_tosca(app_manifest, zones)
+
+
+def gsma_tosca(name: str, zone_id=ZONE_ID):
+    app, artefacts = GSMA_CASES[name]
+    store = {a["artefactId"]: gsma_schemas.Artefact.model_validate(a) for a in artefacts}
+    return gsma2aeros_converter.generate_tosca_from_gsma_with_artefacts(
+        _gsma_app_model(app), zone_id, store.get
+    )
+
+
+def read_snapshot(name: str) -> str:
+    return (SNAPSHOT_DIR / f"{name}.yaml").read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("name", sorted(CAMARA_CASES))
+def test_camara_tosca_matches_snapshot(name):
+    """CAMARA manifest -> TOSCA output is unchanged"""
+    assert camara_tosca(name) == read_snapshot(name)
+
+
+@pytest.mark.parametrize("name", sorted(GSMA_CASES))
+def test_gsma_tosca_matches_snapshot(name):
+    """GSMA app + artefacts -> TOSCA output is unchanged"""
+    assert gsma_tosca(name) == read_snapshot(name)
+
+
+def test_gsma_tosca_unresolved_zone_matches_snapshot():
+    """A GSMA app without a resolved zone gets an empty domain_id constraint"""
+    assert gsma_tosca("gsma_config_artefact", zone_id=None) == read_snapshot("gsma_unresolved_zone")
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+aerOS SQLite storage unit tests
+
+SQLiteAppStorage implements only the CAMARA part of AppStorageManager, so the
+tests run a subclass with the GSMA methods stubbed out against a temporary DB.
+"""
+import sqlite3
+import threading
+import uuid
+
+import pytest
+
+from sunrise6g_opensdk.edgecloud.adapters.aeros.storageManagement.sqlite_storage import (
+    SQLiteAppStorage,
+)
+from sunrise6g_opensdk.edgecloud.core.camara_schemas import AppInstanceInfo
+
+
+def _not_implemented(self, *args, **kwargs):
+    raise NotImplementedError
+
+
+_SQLiteStorage = type(
+    "_SQLiteStorage",
+    (SQLiteAppStorage,),
+    {name: _not_implemented for name in SQLiteAppStorage.__abstractmethods__},
+)
+
+ENDPOINTS = [
+    {
+        "interfaceId": "http_interface",
+        "accessPoints": {"port": 8080, "ipv4Addresses": ["192.168.0.1"]},
+    }
+]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "app_storage.db")
+
+
+@pytest.fixture
+def storage(db_path):
+    return _SQLiteStorage(db_path)
+
+
+def _instance(app_id, name="instance_1", **fields):
+    return AppInstanceInfo.model_validate(
+        {
+            "name": name,
+            "appId": app_id,
+            "appInstanceId": str(uuid.uuid4()),
+            "appProvider": "aerOS_SDK",
+            "status": "ready",
+            "edgeCloudZoneId": str(uuid.uuid4()),
+            **fields,
+        }
+    )
+
+
+def test_store_and_find_deployment(storage):
+    """A stored instance is found by app id and by instance id"""
+    app_id = str(uuid.uuid4())
+    inst = _instance(app_id)
+    storage.store_deployment(inst)
+
+    assert storage.find_deployments(app_id=app_id) == [inst]
+    assert storage.find_deployments(app_instance_id=str(inst.appInstanceId.root)) == [inst]
+    assert storage.get_deployments(app_id) == {app_id: [str(inst.appInstanceId.root)]}
+
+
+def test_bulk_store_deployments(storage):
+    """bulk_store_deployments stores every instance, like repeated store_deployment"""
+    app_id = str(uuid.uuid4())
+    instances = [_instance(app_id, name=f"instance_{i}") for i in range(3)]
+    storage.bulk_store_deployments(instances)
+
+    found = storage.find_deployments(app_id=app_id)
+    assert sorted(i.name.root for i in found) == ["instance_0", "instance_1", "instance_2"]
+    assert sorted(storage.get_deployments()[app_id]) == sorted(
+        str(i.appInstanceId.root) for i in instances
+    )
+
+
+def test_component_endpoint_info_round_trip(storage):
+    """componentEndpointInfo is stored and read back unchanged; none stays None"""
+    app_id = str(uuid.uuid4())
+    with_endpoints = _instance(app_id, componentEndpointInfo=ENDPOINTS)
+    without = _instance(app_id, name="instance_2")
+    storage.bulk_store_deployments([with_endpoints, without])
+
+    by_name = {i.name.root: i for i in storage.find_deployments(app_id=app_id)}
+    assert by_name["instance_1"].componentEndpointInfo == with_endpoints.componentEndpointInfo
+    assert by_name["instance_2"].componentEndpointInfo is None
+
+
+def test_remove_deployment_returns_app_id(storage):
+    """Removing an instance returns its app id, or None if it was not stored"""
+    app_id = str(uuid.uuid4())
+    inst = _instance(app_id)
+    storage.store_deployment(inst)
+
+    assert storage.remove_deployment(str(inst.appInstanceId.root)) == app_id
+    assert storage.remove_deployment(str(inst.appInstanceId.root)) is None
+    assert storage.find_deployments(app_id=app_id) == []
+
+
+def test_duplicate_stopped_instance_is_ignored(storage):
+    """Storing the same stopped instance twice keeps one row"""
+    storage.store_stopped_instance("app-1", "inst-1")
+    storage.store_stopped_instance("app-1", "inst-1")
+    storage.store_stopped_instance("app-1", "inst-2")
+
+    assert storage.get_stopped_instances("app-1") == ["inst-1", "inst-2"]
+    storage.remove_stopped_instances("app-1")
+    assert storage.get_stopped_instances("app-1") == []
+
+
+def test_existing_duplicate_stopped_rows_are_cleaned_up(db_path):
+    """Duplicate rows from a database without the unique index are dropped on open"""
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE stopped (app_id TEXT, app_instance_id TEXT);")
+    conn.executemany(
+        "INSERT INTO stopped VALUES (?, ?);",
+        [("app-1", "inst-1"), ("app-1", "inst-1"), ("app-1", "inst-2")],
+    )
+    conn.commit()
+    conn.close()
+
+    storage = _SQLiteStorage(db_path)
+    assert storage.get_stopped_instances("app-1") == ["inst-1", "inst-2"]
+
+
+def test_threads_use_their_own_connection(storage):
+    """Each thread reads through its own connection and sees committed writes"""
+    storage.store_app("app-1", {"appId": "app-1"})
+    seen = {}
+
+    def read():
+        seen["conn"] = storage.conn
+        seen["app"] = storage.get_app("app-1")
+
+    thread = threading.Thread(target=read)
+    thread.start()
+    thread.join()
+
+    assert seen["conn"] is not storage.conn
+    assert seen["app"] == {"appId": "app-1"}
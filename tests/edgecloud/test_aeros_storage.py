@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+"""
+aerOS in-memory storage unit tests
+
+The reader/writer lock guarding InMemoryAppStorage, the reads that skip it,
+the GSMA write generation that invalidates the client's read cache, and the
+lazily republished zone index.
+"""
+import json
+import threading
+import time
+
+import pytest
+
+from sunrise6g_opensdk.edgecloud.adapters.aeros import config
+from sunrise6g_opensdk.edgecloud.adapters.aeros.client import EdgeApplicationManager
+from sunrise6g_opensdk.edgecloud.adapters.aeros.errors import ResourceNotFoundError
+from sunrise6g_opensdk.edgecloud.adapters.aeros.storageManagement.inMemoryStorage import (
+    InMemoryAppStorage,
+    ReadWriteLock,
+)
+from sunrise6g_opensdk.edgecloud.core import gsma_schemas
+from tests.edgecloud.test_config_gsma import CONFIG
+
+ARTEFACT_PAYLOAD = CONFIG["aeros"]["ARTEFACT_PAYLOAD_GSMA"]
+ARTEFACT_ID = ARTEFACT_PAYLOAD["artefactId"]
+
+# Generous bound for a thread to make progress; only reached when a test fails
+TIMEOUT = 5
+
+
+@pytest.fixture
+def storage():
+    storage = InMemoryAppStorage()
+    storage.reset()
+    yield storage
+    storage.reset()
+
+
+@pytest.fixture
+def manager(storage, monkeypatch):
+    monkeypatch.setattr(config, "aerOS_API_URL", "http://aeros.invalid")
+    monkeypatch.setattr(config, "aerOS_ACCESS_TOKEN", "token")
+    monkeypatch.setattr(config, "aerOS_HLO_TOKEN", "token")
+    return EdgeApplicationManager("http://aeros.invalid", storage=storage)
+
+
+def _artefact(**changes):
+    return gsma_schemas.Artefact.model_validate(dict(ARTEFACT_PAYLOAD, **changes))
+
+
+def _start(target):
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_readers_run_concurrently():
+    """Several threads hold the read lock at the same time"""
+    lock = ReadWriteLock()
+    readers = 3
+    all_inside = threading.Barrier(readers, timeout=TIMEOUT)
+    errors = []
+
+    def read():
+        with lock.read:
+            try:
+                all_inside.wait()
+            except threading.BrokenBarrierError as e:
+                errors.append(e)
+
+    threads = [_start(read) for _ in range(readers)]
+    for thread in threads:
+        thread.join(TIMEOUT)
+    assert not errors
+
+
+def test_writer_blocks_readers():
+    """A reader waits until the writer releases the lock"""
+    lock = ReadWriteLock()
+    has_read = threading.Event()
+
+    def read():
+        with lock.read:
+            has_read.set()
+
+    with lock.write:
+        reader = _start(read)
+        assert not has_read.wait(0.2)
+    assert has_read.wait(TIMEOUT)
+    reader.join(TIMEOUT)
+
+
+def test_waiting_writer_blocks_new_readers():
+    """Once a writer waits, later readers queue behind it"""
+    lock = ReadWriteLock()
+    order = []
+
+    def write():
+        with lock.write:
+            order.append("write")
+
+    def read():
+        with lock.read:
+            order.append("read")
+
+    with lock.read:
+        writer = _start(write)
+        deadline = time.monotonic() + TIMEOUT
+        while not lock._writers_waiting and time.monotonic() < deadline:
+            time.sleep(0.01)
+        reader = _start(read)
+        time.sleep(0.2)
+        assert order == []
+    writer.join(TIMEOUT)
+    reader.join(TIMEOUT)
+    assert order == ["write", "read"]
+
+
+def test_writer_reacquires_without_deadlock():
+    """The writing thread can take either side again"""
+    lock = ReadWriteLock()
+
+    def nested():
+        with lock.write:
+            with lock.write:
+                with lock.read:
+                    pass
+
+    thread = _start(nested)
+    thread.join(TIMEOUT)
+    assert not thread.is_alive()
+    # fully released: another thread can write
+    other = _start(nested)
+    other.join(TIMEOUT)
+    assert not other.is_alive()
+
+
+def test_storage_methods_callable_under_write_lock(storage):
+    """A write section can call other locked storage methods"""
+
+    def write_section():
+        with storage._w:
+            storage.store_app("app-1", {"appId": "app-1"})
+            storage.list_apps()
+            storage.get_deployments()
+
+    thread = _start(write_section)
+    thread.join(TIMEOUT)
+    assert not thread.is_alive()
+    assert storage.list_apps() == [{"appId": "app-1"}]
+
+
+def test_lock_free_reads_see_whole_values(storage):
+    """get_app/app_exists, read without the lock, see a manifest or nothing"""
+    manifest = {"appId": "app-1"}
+    stop = threading.Event()
+    errors = []
+
+    def write():
+        while not stop.is_set():
+            storage.store_app("app-1", manifest)
+            storage.delete_app("app-1")
+
+    def read():
+        try:
+            for _ in range(20000):
+                app = storage.get_app("app-1")
+                assert app is None or app is manifest
+                storage.app_exists("app-1")
+        except AssertionError as e:
+            errors.append(e)
+
+    writer = _start(write)
+    readers = [_start(read) for _ in range(2)]
+    for reader in readers:
+        reader.join(TIMEOUT * 4)
+    stop.set()
+    writer.join(TIMEOUT)
+    assert not errors
+    assert storage.get_app("app-1") is None
+
+
+def test_gsma_writes_bump_generation(storage):
+    """Storing, deleting and popping an artefact each change the generation"""
+    gen = storage.gsma_generation()
+    storage.store_artefact_gsma(_artefact())
+    assert storage.gsma_generation() != gen
+
+    gen = storage.gsma_generation()
+    storage.delete_artefact_gsma(ARTEFACT_ID)
+    assert storage.gsma_generation() != gen
+
+    storage.store_artefact_gsma(_artefact())
+    gen = storage.gsma_generation()
+    assert storage.pop_artefact_gsma(ARTEFACT_ID) is not None
+    assert storage.gsma_generation() != gen
+
+
+def test_gsma_misses_keep_generation(storage):
+    """Removing a record that is not stored leaves the generation (and cache) alone"""
+    gen = storage.gsma_generation()
+    assert storage.pop_artefact_gsma("missing") is None
+    storage.delete_artefact_gsma("missing")
+    storage.delete_app_gsma("missing")
+    assert storage.gsma_generation() == gen
+
+
+def test_deleted_artefact_is_not_served_from_cache(manager):
+    """A read, a delete, then a read: the second read misses"""
+    manager.create_artefact_gsma(ARTEFACT_PAYLOAD)
+    response = manager.get_artefact_gsma(ARTEFACT_ID)
+    assert json.loads(response.content)["artefactId"] == ARTEFACT_ID
+
+    manager.delete_artefact_gsma(ARTEFACT_ID)
+    with pytest.raises(ResourceNotFoundError):
+        manager.get_artefact_gsma(ARTEFACT_ID)
+
+
+def test_storage_write_replaces_cached_body(manager, storage):
+    """A write made directly on the shared storage invalidates the cached body"""
+    manager.create_artefact_gsma(ARTEFACT_PAYLOAD)
+    manager.get_artefact_gsma(ARTEFACT_ID)
+
+    storage.store_artefact_gsma(_artefact(artefactName="renamed"))
+    response = manager.get_artefact_gsma(ARTEFACT_ID)
+    assert json.loads(response.content)["artefactName"] == "renamed"
+
+
+def _zone(domain_id):
+    return {"edgeCloudZoneId": f"uuid-{domain_id}", "edgeCloudZoneName": domain_id}
+
+
+def test_reset_clears_zones(storage):
+    """reset() leaves no zones behind for later tests"""
+    storage.store_zones({"urn:test:reset:a": _zone("urn:test:reset:a")})
+    assert storage.list_zones()
+
+    storage.reset()
+    assert storage.list_zones() == []
+    assert storage.resolve_domain_id_by_zone_uuid("uuid-urn:test:reset:a") is None
+
+
+def test_store_zones_republishes(storage):
+    """Zones stored after a read are visible to the next read"""
+    storage.store_zones({"urn:test:republish:a": _zone("urn:test:republish:a")})
+    assert storage.resolve_domain_id_by_zone_uuid("uuid-urn:test:republish:a") == (
+        "urn:test:republish:a"
+    )
+    assert storage.resolve_domain_id_by_zone_uuid("uuid-urn:test:republish:b") is None
+
+    storage.store_zones({"urn:test:republish:b": _zone("urn:test:republish:b")})
+    names = {zone["edgeCloudZoneName"] for zone in storage.list_zones()}
+    assert {"urn:test:republish:a", "urn:test:republish:b"} <= names
+    assert storage.resolve_domain_ids_by_zone_uuids(
+        ["uuid-urn:test:republish:b", "uuid-unknown"]
+    ) == ["urn:test:republish:b", None]
+
+
+def test_zone_readers_see_whole_batches(storage):
+    """Readers see each store_zones batch entirely or not at all, always resolvable"""
+    batches = 200
+    errors = []
+    done = threading.Event()
+
+    def write():
+        for k in range(batches):
+            storage.store_zones(
+                {f"urn:test:batch:{k}:{side}": _zone(f"urn:test:batch:{k}:{side}") for side in "ab"}
+            )
+        done.set()
+
+    def read():
+        try:
+            while not done.is_set():
+                zones = [
+                    zone
+                    for zone in storage.list_zones()
+                    if zone["edgeCloudZoneName"].startswith("urn:test:batch:")
+                ]
+                names = {zone["edgeCloudZoneName"] for zone in zones}
+                for name in names:
+                    assert name[:-1] + ("b" if name.endswith("a") else "a") in names
+                for zone in zones:
+                    zone_uuid = zone["edgeCloudZoneId"]
+                    assert storage.resolve_domain_id_by_zone_uuid(zone_uuid) is not None
+        except AssertionError as e:
+            errors.append(e)
+
+    readers = [_start(read) for _ in range(2)]
+    writer = _start(write)
+    writer.join(TIMEOUT * 4)
+    for reader in readers:
+        reader.join(TIMEOUT)
+    assert not errors
+    names = [zone["edgeCloudZoneName"] for zone in storage.list_zones()]
+    assert sum(name.startswith("urn:test:batch:") for name in names) == 2 * batches
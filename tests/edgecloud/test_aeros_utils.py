@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+aerOS utils unit tests
+
+Round trips of the CAMARA AppInstanceName codec (encode_app_instance_name /
+decode_app_instance_name) and its escape tables, and the translation of request
+errors and of errors raised while reading a streamed aerOS response.
+"""
+import re
+import string
+
+import pytest
+import requests
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
+
+from sunrise6g_opensdk.edgecloud.adapters.aeros import errors
+from sunrise6g_opensdk.edgecloud.adapters.aeros.utils import (
+    catch_requests_exceptions,
+    decode_app_instance_name,
+    encode_app_instance_name,
+    translate_stream_exception,
+)
+
+ROUND_TRIP_NAMES = [
+    "urn:ngsi-ld:Service:demo-app_01",
+    "demoapp01service",
+    "9starts-with-digit",
+    "_leading_underscore",
+    "a",
+    "",
+    "spaces and\ttabs",
+    "café",
+    "\x00\x7f\xff",
+]
+
+
+@pytest.mark.parametrize("original", ROUND_TRIP_NAMES)
+def test_app_instance_name_round_trip(original):
+    """Decoding an encoded name restores the original string"""
+    encoded = encode_app_instance_name(original, max_len=200)
+    assert decode_app_instance_name(encoded) == original
+
+
+@pytest.mark.parametrize("original", [n for n in ROUND_TRIP_NAMES if n])
+def test_encoded_name_is_valid_app_instance_name(original):
+    """Encoded names only use [A-Za-z0-9_] and start with a letter"""
+    encoded = encode_app_instance_name(original, max_len=200)
+    assert re.fullmatch(r"[A-Za-z][A-Za-z0-9_]*", encoded)
+
+
+def test_every_latin1_char_round_trips():
+    """Each of the 256 escape-table entries decodes back to its character"""
+    for code in range(256):
+        original = f"x{chr(code)}"
+        encoded = encode_app_instance_name(original)
+        assert decode_app_instance_name(encoded) == original
+
+
+def test_escape_format():
+    """Allowed characters pass through; everything else, '_' included, becomes _hh"""
+    assert encode_app_instance_name("abcXYZ019") == "abcXYZ019"
+    assert encode_app_instance_name("a_b") == "a_5fb"
+    assert encode_app_instance_name("a:b-c") == "a_3ab_2dc"
+    assert encode_app_instance_name("1ab") == "A0_1ab"
+    assert encode_app_instance_name(":ab") == "A0__3aab"
+
+
+def test_decode_accepts_upper_case_hex():
+    """Escapes are decoded case-insensitively"""
+    assert decode_app_instance_name("a_3Ab_2D") == "a:b-"
+
+
+def test_encode_rejects_names_over_max_len():
+    """Names that do not fit are refused rather than truncated"""
+    with pytest.raises(ValueError):
+        encode_app_instance_name("a" * 65)
+    with pytest.raises(ValueError):
+        encode_app_instance_name(":" * 21)  # 3-char prefix + 21 * 3 = 66
+
+
+@pytest.mark.parametrize(
+    "encoded, message",
+    [
+        ("ab_", "Invalid escape at end of string."),
+        ("ab_4", "Invalid escape at end of string."),
+        ("ab_zz", "Invalid escape sequence: _zz"),
+        ("ab_4G", "Invalid escape sequence: _4g"),
+        ("ab__41", "Invalid escape sequence: __4"),
+    ],
+)
+def test_decode_rejects_malformed_escapes(encoded, message):
+    """Malformed escapes raise ValueError"""
+    with pytest.raises(ValueError, match=re.escape(message)):
+        decode_app_instance_name(encoded)
+
+
+def test_allowed_alphabet_is_not_escaped():
+    """Every ASCII letter and digit is kept as is"""
+    alphabet = string.ascii_letters + string.digits
+    assert encode_app_instance_name(alphabet) == alphabet
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (ReadTimeoutError(None, "/entities", "Read timed out."), errors.ServiceUnavailableError),
+        (ProtocolError("Connection broken"), errors.EdgeCloudPlatformError),
+        (
+            DecodeError("Received response with content-encoding: gzip"),
+            errors.EdgeCloudPlatformError,
+        ),
+    ],
+)
+def test_stream_errors_become_app_errors(error, expected):
+    """urllib3 errors from reading response.raw are raised as the adapter's errors"""
+    with pytest.raises(expected) as exc_info:
+        translate_stream_exception(error)
+    assert exc_info.value.__cause__.__cause__ is error
+
+
+def test_other_stream_errors_are_reraised():
+    """Errors that are not urllib3 read errors propagate unchanged"""
+    error = KeyError("domain")
+    with pytest.raises(KeyError) as exc_info:
+        translate_stream_exception(error)
+    assert exc_info.value is error
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        requests.ConnectionError("Name or service not known"),
+        ConnectionRefusedError("Connection refused"),
+        requests.Timeout("Read timed out"),
+    ],
+)
+def test_connection_errors_become_service_unavailable(error):
+    """Connection failures and timeouts raise ServiceUnavailableError"""
+
+    @catch_requests_exceptions
+    def call():
+        raise error
+
+    with pytest.raises(errors.ServiceUnavailableError) as exc_info:
+        call()
+    assert exc_info.value.__cause__ is error
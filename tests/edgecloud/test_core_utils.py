@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+edgecloud core utils unit tests
+
+build_custom_http_response serializes dict/list content the same way with and
+without the optional orjson encoder.
+"""
+import enum
+import json
+import uuid
+
+import pytest
+
+from sunrise6g_opensdk.edgecloud.core import utils
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class Size(enum.IntEnum):
+    SMALL = 1
+
+
+class Kind(str, enum.Enum):
+    CONTAINER = "CONTAINER"
+
+
+PAYLOAD = {
+    "id": uuid.UUID("550e8400-e29b-41d4-a716-446655440000"),
+    "color": Color.RED,
+    "size": Size.SMALL,
+    "kind": Kind.CONTAINER,
+    "name": "café",
+    "values": [1, 2.5, None, True, float("nan"), float("inf")],
+    "nested": {"ids": (uuid.UUID(int=1),), "colors": [Color.RED]},
+}
+
+
+def _body(monkeypatch, encoder):
+    monkeypatch.setattr(utils, "orjson", encoder)
+    response = utils.build_custom_http_response(status_code=200, content=PAYLOAD)
+    return response.content
+
+
+def test_json_fallback_matches_orjson(monkeypatch):
+    """The json fallback writes the same bytes as orjson"""
+    orjson = pytest.importorskip("orjson")
+    assert _body(monkeypatch, None) == _body(monkeypatch, orjson)
+
+
+def test_json_fallback_output(monkeypatch):
+    """UUIDs and Enums become their values, non-finite floats null"""
+    assert json.loads(_body(monkeypatch, None)) == {
+        "id": "550e8400-e29b-41d4-a716-446655440000",
+        "color": "red",
+        "size": 1,
+        "kind": "CONTAINER",
+        "name": "café",
+        "values": [1, 2.5, None, True, None, None],
+        "nested": {"ids": ["00000000-0000-0000-0000-000000000001"], "colors": ["red"]},
+    }
+
+
+def test_json_fallback_rejects_unknown_types(monkeypatch):
+    """Types neither encoder supports raise TypeError"""
+    monkeypatch.setattr(utils, "orjson", None)
+    with pytest.raises(TypeError):
+        utils.build_custom_http_response(status_code=200, content={"value": object()})